@@ -5,8 +5,16 @@ Keeps the first occurrence of each (gamekey, name) combination.
 If multiple entries exist with different key values, keeps the one with a valid key.
 """
 import csv
+import re
 from pathlib import Path
 
+# Same rule as valid_steam_key() in the main script: three dash-separated groups of 5
+STEAM_KEY_PATTERN = re.compile(r'[^-]{5}-[^-]{5}-[^-]{5}')
+
+def valid_steam_key(key):
+    """Check if key is valid Steam key format."""
+    return isinstance(key, str) and STEAM_KEY_PATTERN.fullmatch(key) is not None
+
 def cleanup_errored_csv():
     """Remove duplicates from errored.csv, preferring entries with valid keys."""
     errored_file = Path("errored.csv")
@@ -15,54 +23,37 @@ def cleanup_errored_csv():
         print("errored.csv not found")
         return
     
-    # Read all entries
-    entries = []
-    with errored_file.open("r", encoding="utf-8-sig") as f:
+    # Stream rows straight into the dedup map instead of building an entry list first
+    # Deduplicate: keep best entry for each (gamekey, name) combination
+    total_entries = 0
+    seen = {}  # (gamekey, name) -> (is_valid, best (gamekey, name, key_val) row)
+    with errored_file.open("r", encoding="utf-8-sig", newline='') as f:
         reader = csv.reader(f)
         for row in reader:
-            if len(row) >= 3:
-                entries.append({
-                    'gamekey': row[0].strip(),
-                    'name': row[1].strip(),
-                    'key_val': row[2].strip()
-                })
-    
-    print(f"Found {len(entries)} total entries")
-    
-    # Deduplicate: keep best entry for each (gamekey, name) combination
-    def valid_steam_key(key):
-        """Check if key is valid Steam key format."""
-        if not isinstance(key, str) or not key:
-            return False
-        key_parts = key.split("-")
-        return (
-            len(key) == 17
-            and len(key_parts) == 3
-            and all(len(part) == 5 for part in key_parts)
-        )
-    
-    seen = {}  # (gamekey, name) -> best entry
-    for entry in entries:
-        key_id = (entry['gamekey'], entry['name'].lower())
-        key_val = entry['key_val']
-        
-        if key_id not in seen:
-            # First occurrence - keep it
-            seen[key_id] = entry
-        else:
-            # Already seen - keep the better one
-            existing = seen[key_id]
-            existing_val = existing['key_val']
+            if len(row) < 3:
+                continue
+            entry = (row[0].strip(), row[1].strip(), row[2].strip())
+            if total_entries == 0 and entry[0].lower() == "gamekey":
+                # Header row - a new one is written below
+                continue
+            total_entries += 1
+            key_id = (entry[0], entry[1].lower())
             
-            # Prefer valid keys over empty/invalid ones
-            if not valid_steam_key(existing_val) and valid_steam_key(key_val):
-                seen[key_id] = entry
+            existing = seen.get(key_id)
+            if existing is None:
+                # First occurrence - keep it, remembering whether its key is valid
+                seen[key_id] = (valid_steam_key(entry[2]), entry)
+            # Already seen - prefer valid keys over empty/invalid ones
             # If both are invalid or both are valid, keep the first one
+            elif not existing[0] and valid_steam_key(entry[2]):
+                seen[key_id] = (True, entry)
+    
+    print(f"Found {total_entries} total entries")
     
     # Write deduplicated entries back
-    unique_entries = list(seen.values())
+    unique_entries = [entry for is_valid, entry in seen.values()]
     print(f"After deduplication: {len(unique_entries)} unique entries")
-    print(f"Removed {len(entries) - len(unique_entries)} duplicates")
+    print(f"Removed {total_entries - len(unique_entries)} duplicates")
     
     # Backup original file
     backup_file = errored_file.with_suffix('.csv.backup')
@@ -73,8 +64,7 @@ def cleanup_errored_csv():
     with errored_file.open("w", encoding="utf-8-sig", newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['gamekey', 'human_name', 'redeemed_key_val'])  # Header
-        for entry in unique_entries:
-            writer.writerow([entry['gamekey'], entry['name'], entry['key_val']])
+        writer.writerows(unique_entries)
     
     print(f"✓ Cleaned errored.csv written")
     print(f"✓ Original backed up to {backup_file}")
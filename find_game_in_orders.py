@@ -2,22 +2,41 @@
 """Find a specific game in Humble Bundle orders."""
 
 import sys
+import time
 from pathlib import Path
 
+# The main module is imported inside the functions that need it, so the
+# browser helpers (and Selenium) only load when orders must be fetched
 sys.path.insert(0, str(Path(__file__).parent))
-from humblesteamkeysredeemer import (
-    get_browser_driver, validate_session, find_dict_keys,
-    getHumbleOrders, try_recover_cookies, verify_logins_session
-)
-import time
 
-def find_game(game_name):
-    """Find a game in order details."""
-    print(f"Searching for: {game_name}\n")
+try:
+    from rapidfuzz import process, fuzz, utils
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+SIMILAR_NAMES_LIMIT = 10  # Max similar names to show when there's no match
+SIMILAR_NAMES_MIN_SCORE = 60  # rapidfuzz score cutoff (0-100)
+
+NOT_FOUND_HELP = """
+This could mean:
+  1. It hasn't been selected from a Choice month yet
+  2. It's from a bundle you haven't purchased
+  3. The name might be slightly different
+
+Searching for similar names..."""
+
+def fetch_order_details():
+    """Fetch order details through the browser. Returns None on failure."""
+    from humblesteamkeysredeemer import (
+        get_browser_driver, validate_session, getHumbleOrders,
+        try_recover_cookies, verify_logins_session, _save_cache
+    )
     
     driver = get_browser_driver(headless=False)
     try:
         # Load saved cookies
+        session_verified = False
         cookie_file = Path(".humblecookies")
         if cookie_file.exists():
             driver.get("https://www.humblebundle.com/")
@@ -25,93 +44,125 @@ def find_game(game_name):
             if try_recover_cookies(cookie_file, driver):
                 time.sleep(1)
                 if verify_logins_session(driver)[0]:
+                    session_verified = True
                     print("✓ Using saved session")
         
-        driver.get("https://www.humblebundle.com/home/library")
-        time.sleep(3)
+        # The order fetch works from any humblebundle.com page, so the extra
+        # library page load is only needed when the saved session didn't verify
+        if not session_verified:
+            driver.get("https://www.humblebundle.com/home/library")
+            time.sleep(3)
         
         if not validate_session(driver):
             print("ERROR: Session invalid")
-            return
+            return None
         
         print("Fetching orders...")
-        order_details = driver.execute_async_script(getHumbleOrders.replace('%optional%', '[]'))
+        order_details = driver.execute_async_script(getHumbleOrders, [])
         
         if isinstance(order_details, dict) and 'error' in order_details:
             print(f"ERROR: {order_details.get('message')}")
-            return
+            return None
         
         if not isinstance(order_details, list):
             print(f"ERROR: Unexpected format")
-            return
+            return None
         
         print(f"✓ Fetched {len(order_details)} orders\n")
-        
-        # Search for the game
-        game_name_lower = game_name.lower()
-        found = False
-        
-        # Search in all steam keys
-        steam_keys = list(find_dict_keys(order_details, "steam_app_id", True))
-        print(f"Searching through {len(steam_keys)} Steam keys...\n")
-        
-        for key in steam_keys:
-            name = key.get("human_name", "").lower()
-            if game_name_lower in name:
-                found = True
-                print(f"✓ FOUND!")
-                print(f"  Name: {key.get('human_name', 'Unknown')}")
-                print(f"  Gamekey: {key.get('gamekey', 'Unknown')}")
-                print(f"  Steam App ID: {key.get('steam_app_id', 'Unknown')}")
-                
-                if "redeemed_key_val" in key:
-                    key_val = key.get("redeemed_key_val", "")
-                    if key_val and key_val != "EXPIRED":
-                        print(f"  Status: REVEALED (key: {key_val})")
-                    elif key_val == "EXPIRED":
-                        print(f"  Status: EXPIRED")
-                    else:
-                        print(f"  Status: REVEALED (no key value)")
+        _save_cache("humble_order_details", order_details)
+        return order_details
+    finally:
+        driver.quit()
+
+def find_game(game_name):
+    """Find a game in order details."""
+    from humblesteamkeysredeemer import find_dict_keys, _load_cache
+    
+    print(f"Searching for: {game_name}\n")
+    
+    # Reuse the order details cached by the main script, same 1 hour window
+    order_details, is_valid = _load_cache("humble_order_details", max_age_hours=1)
+    if is_valid and order_details:
+        print(f"✓ Using cached order details ({len(order_details)} orders)\n")
+    else:
+        order_details = fetch_order_details()
+        if order_details is None:
+            return
+    
+    # Search for the game
+    game_name_lower = game_name.lower()
+    found = False
+    
+    # Search in all steam keys
+    steam_keys = list(find_dict_keys(order_details, "steam_app_id", True))
+    print(f"Searching through {len(steam_keys)} Steam keys...\n")
+    
+    # Lowercase each name once; both the exact and the similar-name pass reuse it
+    names_lower = [key.get("human_name", "").lower() for key in steam_keys]
+    
+    # First order per gamekey, so each match is a dict lookup instead of a scan
+    orders_by_gamekey = {}
+    for order in order_details:
+        orders_by_gamekey.setdefault(order.get("gamekey"), order)
+    
+    for key, name in zip(steam_keys, names_lower):
+        if game_name_lower in name:
+            found = True
+            # Build the whole entry and print it with a single write
+            lines = [
+                "✓ FOUND!",
+                f"  Name: {key.get('human_name', 'Unknown')}",
+                f"  Gamekey: {key.get('gamekey', 'Unknown')}",
+                f"  Steam App ID: {key.get('steam_app_id', 'Unknown')}",
+            ]
+            
+            if "redeemed_key_val" in key:
+                key_val = key.get("redeemed_key_val", "")
+                if key_val and key_val != "EXPIRED":
+                    lines.append(f"  Status: REVEALED (key: {key_val})")
+                elif key_val == "EXPIRED":
+                    lines.append("  Status: EXPIRED")
                 else:
-                    print(f"  Status: NOT REVEALED YET")
-                
-                # Check which order it's from
-                for order in order_details:
-                    if order.get("gamekey") == key.get("gamekey"):
-                        order_name = order.get("product", {}).get("human_name", "Unknown")
-                        print(f"  Order: {order_name}")
-                        
-                        # Check if it's a Choice month
-                        if "choice_url" in order.get("product", {}):
-                            print(f"  Type: Humble Choice")
-                        break
-                
-                print()
-        
-        if not found:
-            print(f"✗ {game_name} NOT found in your orders")
-            print("\nThis could mean:")
-            print("  1. It hasn't been selected from a Choice month yet")
-            print("  2. It's from a bundle you haven't purchased")
-            print("  3. The name might be slightly different")
-            print("\nSearching for similar names...")
+                    lines.append("  Status: REVEALED (no key value)")
+            else:
+                lines.append("  Status: NOT REVEALED YET")
             
-            # Show similar games
-            similar = []
-            for key in steam_keys:
-                name = key.get("human_name", "").lower()
-                words = game_name_lower.split()
-                if any(word in name for word in words if len(word) > 3):
-                    similar.append(key.get("human_name", "Unknown"))
+            # Check which order it's from
+            order = orders_by_gamekey.get(key.get("gamekey"))
+            if order is not None:
+                order_name = order.get("product", {}).get("human_name", "Unknown")
+                lines.append(f"  Order: {order_name}")
+                
+                # Check if it's a Choice month
+                if "choice_url" in order.get("product", {}):
+                    lines.append("  Type: Humble Choice")
             
-            if similar:
-                print("\nSimilar games found:")
-                for name in set(similar)[:10]:
-                    print(f"  - {name}")
+            print("\n".join(lines) + "\n")
+    
+    if not found:
+        print(f"✗ {game_name} NOT found in your orders\n{NOT_FOUND_HELP}")
         
-        input("\nPress Enter to close...")
-    finally:
-        driver.quit()
+        # Show similar games (unique names, best matches first)
+        if HAS_RAPIDFUZZ:
+            names = list(dict.fromkeys(key.get("human_name", "Unknown") for key in steam_keys))
+            matches = process.extract(
+                game_name, names, scorer=fuzz.WRatio, processor=utils.default_process,
+                limit=SIMILAR_NAMES_LIMIT, score_cutoff=SIMILAR_NAMES_MIN_SCORE
+            )
+            similar = [name for name, score, idx in matches]
+        else:
+            words = [word for word in game_name_lower.split() if len(word) > 3]
+            similar = [
+                key.get("human_name", "Unknown")
+                for key, name in zip(steam_keys, names_lower)
+                if any(word in name for word in words)
+            ]
+            similar = list(dict.fromkeys(similar))[:SIMILAR_NAMES_LIMIT]
+        
+        if similar:
+            print("\nSimilar games found:\n" + "\n".join(f"  - {name}" for name in similar))
+    
+    input("\nPress Enter to close...")
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
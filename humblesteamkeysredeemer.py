@@ -1,7 +1,9 @@
 import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+# selenium.webdriver, fuzzywuzzy and steam.webauth are slow to import and
+# only needed by the browser, matching and Steam login paths, so they are
+# imported where used; helper scripts importing this module skip the cost
 from selenium.common.exceptions import (
     WebDriverException, 
     TimeoutException,
@@ -9,8 +11,6 @@ from selenium.common.exceptions import (
     NoSuchWindowException,
     StaleElementReferenceException
 )
-from fuzzywuzzy import fuzz
-import steam.webauth as wa
 import time
 import pickle
 from pwinput import pwinput
@@ -24,7 +24,7 @@ import atexit
 import signal
 from http.client import responses
 from http import HTTPStatus
-from typing import Union, Dict, Any, Tuple, Optional
+from typing import Union, Dict, Any, Tuple, Optional, TYPE_CHECKING
 import argparse
 import csv
 import threading
@@ -35,7 +35,14 @@ from logging.handlers import RotatingFileHandler
 from contextlib import contextmanager
 from pathlib import Path
 import hashlib
+import random
+import io
+import traceback
 from enum import IntEnum
+from types import MappingProxyType
+
+if TYPE_CHECKING:
+    from selenium import webdriver
 import re
 
 # Try to import encryption support
@@ -45,6 +52,20 @@ try:
 except ImportError:
     HAS_ENCRYPTION = False
 
+# Try to import faster JSON support (used for the on-disk caches)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Try to import faster fuzzy matching (falls back to fuzzywuzzy)
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 # Try to import file locking support
 try:
     import fcntl
@@ -86,6 +107,10 @@ class SteamErrorCode(IntEnum):
     EXPIRED = -1  # Key expired on Humble Bundle (not a Steam error)
 
 
+# String codes accepted by normalize_error_code (legacy callers pass "EXPIRED")
+_STRING_ERROR_CODES = {"EXPIRED": SteamErrorCode.EXPIRED}
+
+
 def normalize_error_code(code: Union[SteamErrorCode, int, str]) -> Union[SteamErrorCode, int]:
     """
     Normalize error code to int/IntEnum type for consistent handling.
@@ -110,13 +135,17 @@ def normalize_error_code(code: Union[SteamErrorCode, int, str]) -> Union[SteamEr
         >>> normalize_error_code(0)
         0
     """
+    # Exact type checks first - this runs for every redeemed key
+    code_type = type(code)
+    if code_type is SteamErrorCode or code_type is int:
+        return code
     if isinstance(code, str):
-        if code == "EXPIRED":
-            return SteamErrorCode.EXPIRED
-        else:
+        normalized = _STRING_ERROR_CODES.get(code)
+        if normalized is None:
             logging.warning(f"Unknown string error code: {code}, treating as generic error")
             return -2  # Generic error code for unknown string codes
-    elif isinstance(code, (int, IntEnum)):
+        return normalized
+    elif isinstance(code, int):  # Other int subclasses
         return code
     else:
         raise ValueError(f"Invalid code type: {type(code)}, expected SteamErrorCode, int, or str")
@@ -127,11 +156,11 @@ FRIEND_KEY_HIGH_CONFIDENCE_THRESHOLD = 0.8
 FRIEND_KEY_LOW_CONFIDENCE_THRESHOLD = 0.5
 
 # Success codes for Steam key redemption (used for cleanup operations)
-SUCCESS_CODES = {
+SUCCESS_CODES = frozenset({
     SteamErrorCode.SUCCESS,
     SteamErrorCode.ALREADY_OWNED,
     SteamErrorCode.DUPLICATE_KEY
-}
+})
 
 # CSV file paths used by the script
 class CSVFiles:
@@ -145,6 +174,8 @@ class CSVFiles:
     SKIPPED = "skipped.txt"
     
     # File operation configuration
+    # Written with a BOM so Excel detects UTF-8 game names; utf-8-sig also
+    # reads files with or without one, so keep this for reads and writes
     ENCODING = "utf-8-sig"
     
     @classmethod
@@ -155,18 +186,28 @@ class CSVFiles:
 
 # Mapping from error codes to CSV files for cleaner code organization
 # Defined after CSVFiles class to avoid forward reference errors
-CODE_TO_FILE_MAP = {
+# Read-only: a long-running --auto session must never remap codes by accident
+CODE_TO_FILE_MAP = MappingProxyType({
     SteamErrorCode.SUCCESS: CSVFiles.REDEEMED,
     SteamErrorCode.DUPLICATE_KEY: CSVFiles.ALREADY_OWNED,
     SteamErrorCode.ALREADY_OWNED: CSVFiles.ALREADY_OWNED,
     SteamErrorCode.EXPIRED: CSVFiles.EXPIRED,
-}
+})
 
 # CSV encoding constant (for backward compatibility and convenience)
 CSV_ENCODING = CSVFiles.ENCODING
 
 # Compiled regex patterns for better performance (compiled once at module level)
 PLATFORM_SUFFIX_PATTERN = re.compile(r'\s*\(Steam\)\s*$', re.IGNORECASE)
+CLOUDFLARE_CHALLENGE_PATTERN = re.compile(r'challenge|cloudflare|just a moment|checking your browser', re.IGNORECASE)
+EXPIRED_ERROR_PATTERN = re.compile(r'expired', re.IGNORECASE)  # Humble reveal error for expired keys
+STEAM_KEY_PATTERN = re.compile(r'[^-]{5}-[^-]{5}-[^-]{5}')  # Use with fullmatch(); AAAAA-BBBBB-CCCCC
+
+# stderr level detection for LoggerWriter (one regex pass per line instead of lower() + substring scans)
+STDERR_FRAME_PATTERN = re.compile(r'File "[/<]|line |in _log|in handle|in emit|in flush')
+STDERR_ERROR_PATTERN = re.compile(r'error|exception|fail|traceback', re.IGNORECASE)  # "fail" covers "failed"
+STDERR_WARNING_PATTERN = re.compile(r'warn', re.IGNORECASE)  # Covers "warning"
+STDERR_DEBUG_PATTERN = re.compile(r'debug', re.IGNORECASE)  # Covers "[debug]"
 
 # Windows file locking constants
 # Lock 1 byte at offset 0 - this is the standard practice for file locking on Windows.
@@ -184,6 +225,10 @@ CACHE_DIR.mkdir(exist_ok=True)
 # Cache version - increment when data structure changes to invalidate old caches
 CACHE_VERSION = 1
 
+# Steam app list cache lifetimes
+STEAM_APP_LIST_CACHE_HOURS = 24 * 7  # Used as-is while younger than this
+STEAM_APP_LIST_MAX_STALE_HOURS = 24 * 90  # Older lists are refetched in full instead of updated
+
 # Choice month completion tracking file
 CHOICE_COMPLETED_FILE = Path(".choice_completed.json")
 
@@ -198,15 +243,18 @@ def load_completed_choice_months():
         return set()
     
     try:
-        with open(CHOICE_COMPLETED_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Support both old format (list) and new format (dict with metadata)
-            if isinstance(data, list):
-                return set(data)
-            elif isinstance(data, dict) and 'completed_months' in data:
-                return set(data['completed_months'])
-            else:
-                return set()
+        if HAS_ORJSON:
+            data = orjson.loads(CHOICE_COMPLETED_FILE.read_bytes())
+        else:
+            with open(CHOICE_COMPLETED_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        # Support both old format (list) and new format (dict with metadata)
+        if isinstance(data, list):
+            return set(data)
+        elif isinstance(data, dict) and 'completed_months' in data:
+            return set(data['completed_months'])
+        else:
+            return set()
     except (IOError, json.JSONDecodeError, UnicodeDecodeError) as e:
         logging.warning(f"Error loading completed Choice months: {e}")
         return set()
@@ -224,12 +272,30 @@ def save_completed_choice_months(completed_months):
             'last_updated': datetime.now().isoformat(),
             'version': 1
         }
-        with open(CHOICE_COMPLETED_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        if HAS_ORJSON:
+            CHOICE_COMPLETED_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(CHOICE_COMPLETED_FILE, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
     except (IOError, OSError, TypeError) as e:
         logging.error(f"Error saving completed Choice months: {e}")
 
-def is_choice_month_complete(month_gamekey, order_details):
+def get_processed_choice_keys():
+    """
+    Return set of (gamekey, name_lower) tuples that count as done for Choice months.
+    
+    Build this once and pass it to is_choice_month_complete() when checking
+    many months, instead of copying both cached sets for every month.
+    """
+    if not _CACHE_INITIALIZED:
+        _initialize_keys_cache()
+    
+    # The union is already a new set, so no need to copy each cached set first
+    with _CACHE_LOCK:
+        return (_EXISTING_KEYS_CACHE.get(CSVFiles.REDEEMED, set())
+                | _EXISTING_KEYS_CACHE.get(CSVFiles.ALREADY_OWNED, set()))
+
+def is_choice_month_complete(month_gamekey, order_details, processed_keys=None):
     """
     Check if a Choice month is complete (all games selected and all keys redeemed).
     
@@ -240,6 +306,7 @@ def is_choice_month_complete(month_gamekey, order_details):
     Args:
         month_gamekey: The gamekey of the Choice month
         order_details: The order details dictionary
+        processed_keys: Optional prebuilt set from get_processed_choice_keys()
         
     Returns:
         True if the month is complete, False otherwise
@@ -254,33 +321,26 @@ def is_choice_month_complete(month_gamekey, order_details):
     if not month:
         return False
     
-    # Check if all games are selected
-    tpkd_dict = month.get('tpkd_dict', {})
-    chosen_games = set(find_dict_keys(tpkd_dict, "machine_name"))
-    
-    # Get all games for this month
-    month_keys = [key for key in find_dict_keys(order_details, "steam_app_id", True) 
-                  if key.get('gamekey') == month_gamekey]
-    
-    if not month_keys:
-        # No keys found for this month - might not be a Choice month
-        return False
-    
     # Check if all keys are redeemed or already owned
-    redeemed_keys = _get_cached_keys(CSVFiles.REDEEMED)
-    owned_keys = _get_cached_keys(CSVFiles.ALREADY_OWNED)
-    all_keys = redeemed_keys | owned_keys
+    all_keys = processed_keys if processed_keys is not None else get_processed_choice_keys()
     
-    for key in month_keys:
+    # Walk only this month's order (its keys carry the month's gamekey) and
+    # stop at the first key that isn't redeemed/owned
+    found_keys = False
+    for key in find_dict_keys(month, "steam_app_id", True):
         gamekey = key.get('gamekey', '')
+        if gamekey != month_gamekey:
+            continue
+        found_keys = True
         human_name = key.get('human_name', '')
         if gamekey and human_name:
             if (gamekey, human_name.lower()) not in all_keys:
                 # At least one key is not redeemed/owned
                 return False
     
-    # All keys are redeemed/owned - month is complete
-    return True
+    # No keys found for this month - might not be a Choice month
+    # Otherwise all keys are redeemed/owned - month is complete
+    return found_keys
 
 def mark_choice_month_complete(month_gamekey):
     """
@@ -308,6 +368,8 @@ MEDIUM_SLEEP_SECONDS = 2  # Medium sleep for page loads
 LONG_SLEEP_SECONDS = 3  # Long sleep for complex operations
 EXTENDED_SLEEP_SECONDS = 5  # Extended sleep for retries and longer waits
 VERY_LONG_SLEEP_SECONDS = 30  # Very long sleep (e.g., after rate limit)
+RETRY_BACKOFF_MAX_SECONDS = 30  # Cap for exponential retry backoff
+RETRY_BACKOFF_JITTER_SECONDS = 0.5  # Random extra delay so retries don't fire in lockstep
 
 # Rate limiting
 RATE_LIMIT_RETRY_INTERVAL_SECONDS = 300  # 5 minutes between retries
@@ -326,12 +388,19 @@ SESSION_VALIDATION_TIMEOUT_SECONDS = 10  # Session validation timeout
 PROGRESS_DOT_INTERVAL_SECONDS = 5  # Progress indicator update interval
 
 # File operations
-CSV_FLUSH_INTERVAL = 1  # Flush CSV after each write
+# Key CSVs are written and flushed one row at a time on purpose: a revealed
+# key exists nowhere else, so it must be on disk before the next reveal
 LOG_ROTATION_MAX_BYTES = 10 * 1024 * 1024  # 10MB
 LOG_ROTATION_BACKUP_COUNT = 3  # Keep 3 backup log files
 
 # Browser detection
 BROWSER_DETECTION_TIMEOUT_SECONDS = 5  # Timeout for browser detection
+DRIVER_PATH_CACHE_HOURS = 24  # Reuse a webdriver-manager driver path without its network version check
+
+# Humble Choice
+HUMBLE_HTTP_POOL_SIZE = 8  # Keep-alive connections kept open to Humble for Choice page fetches
+CHOICE_FETCH_WORKERS = HUMBLE_HTTP_POOL_SIZE  # Choice month pages fetched concurrently
+CHOICE_PREFETCH_MONTHS = 2  # Months get_choices fetches ahead of the one it is yielding
 
 # Legacy constant removed - all references now use SCRIPT_TIMEOUT_SECONDS directly
 
@@ -343,9 +412,6 @@ try:
 except ImportError:
     HAS_WEBDRIVER_MANAGER = False
 
-#patch steam webauth for password feedback
-wa.getpass = pwinput
-
 # Setup proper logging with rotation
 def setup_logging():
     """Setup rotating log handler to prevent unbounded log growth."""
@@ -374,7 +440,7 @@ def setup_logging():
     class LoggerWriter:
         def __init__(self, logger):
             self.logger = logger
-            self.buffer = []
+            self.buffer = io.StringIO()
             self._logging = False  # Flag to prevent recursive logging
         
         def write(self, message):
@@ -385,10 +451,9 @@ def setup_logging():
             
             # Buffer messages to handle multi-line output
             if message and message != '\n':
-                self.buffer.append(message)
-                if message.endswith('\n') or '\n' in message:
-                    full_message = ''.join(self.buffer).strip()
-                    self.buffer = []
+                self.buffer.write(message)
+                if '\n' in message:
+                    full_message = self._take_buffer()
                     if full_message:
                         # Skip messages that are already formatted log messages to prevent loops
                         if full_message.startswith(('ERROR:', 'WARNING:', 'INFO:', 'DEBUG:')):
@@ -396,6 +461,13 @@ def setup_logging():
                         else:
                             self._log_with_level(full_message)
         
+        def _take_buffer(self):
+            """Return the stripped buffered text and reset the buffer in place."""
+            full_message = self.buffer.getvalue().strip()
+            self.buffer.seek(0)
+            self.buffer.truncate()
+            return full_message
+        
         def _log_with_level(self, message):
             """Detect log level from message content."""
             # Prevent recursive logging
@@ -405,22 +477,21 @@ def setup_logging():
             
             self._logging = True
             try:
-                msg_lower = message.lower()
                 # Skip if message is already a formatted log message
                 if message.startswith(('ERROR:', 'WARNING:', 'INFO:', 'DEBUG:')):
                     sys.__stderr__.write(message + '\n')
                     return
                 
                 # Skip traceback/stack frames to prevent recursion
-                if any(x in message for x in ['File "/', 'File "<', 'line ', 'in _log', 'in handle', 'in emit', 'in flush']):
+                if STDERR_FRAME_PATTERN.search(message):
                     sys.__stderr__.write(message + '\n')
                     return
                 
-                if any(x in msg_lower for x in ['error', 'exception', 'failed', 'fail', 'traceback']):
+                if STDERR_ERROR_PATTERN.search(message):
                     self.logger.error(message)
-                elif any(x in msg_lower for x in ['warning', 'warn']):
+                elif STDERR_WARNING_PATTERN.search(message):
                     self.logger.warning(message)
-                elif any(x in msg_lower for x in ['debug', '[debug]']):
+                elif STDERR_DEBUG_PATTERN.search(message):
                     self.logger.debug(message)
                 else:
                     # Default to warning for stderr (since it's usually important)
@@ -431,11 +502,10 @@ def setup_logging():
         def flush(self):
             # Don't log from flush() - just write buffer directly to stderr to prevent recursion
             # flush() is called by logging handlers, so we can't log from here
-            if self.buffer:
-                full_message = ''.join(self.buffer).strip()
+            if self.buffer.tell():
+                full_message = self._take_buffer()
                 if full_message:
                     sys.__stderr__.write(full_message + '\n')
-                self.buffer = []
             # Also flush the original stderr
             try:
                 sys.__stderr__.flush()
@@ -502,12 +572,12 @@ def retry_on_session_error(max_retries=3, delay=2):
                     if attempt == max_retries - 1:
                         raise
                     print(f"[DEBUG] Session error in {func.__name__}, attempt {attempt + 1}/{max_retries}: {e}")
-                    time.sleep(delay)
+                    interruptible_sleep(delay)
                 except TimeoutException as e:
                     if attempt == max_retries - 1:
                         raise
                     print(f"[DEBUG] Timeout in {func.__name__}, attempt {attempt + 1}/{max_retries}")
-                    time.sleep(delay)
+                    interruptible_sleep(delay)
             return None
         return wrapper
     return decorator
@@ -541,20 +611,47 @@ def refresh_page_if_needed(driver, url=None):
 
 
 def find_dict_keys(node, kv, parent=False):
-    """Recursively find all values (or parent dicts) with a given key."""
-    if isinstance(node, list):
-        for i in node:
-            for x in find_dict_keys(i, kv, parent):
-               yield x
-    elif isinstance(node, dict):
-        if kv in node:
-            if parent:
-                yield node
-            else:
-                yield node[kv]
-        for j in node.values():
-            for x in find_dict_keys(j, kv, parent):
-                yield x
+    """
+    Find all values (or parent dicts) with a given key.
+    
+    Walks the tree with an explicit stack instead of nested generators, so
+    deep order JSON doesn't pay per-level generator overhead. Results come
+    out in the same depth-first order as a recursive walk. Only dicts and
+    lists are pushed (exact type checks - this walks decoded JSON), so the
+    many scalar leaves never go through the stack.
+    """
+    stack = [node]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        node = pop()
+        node_type = type(node)
+        if node_type is dict:
+            if kv in node:
+                if parent:
+                    yield node
+                else:
+                    yield node[kv]
+            children = reversed(list(node.values()))
+        elif node_type is list:
+            children = reversed(node)
+        else:
+            continue
+        extend([child for child in children if type(child) is dict or type(child) is list])
+
+def partition_revealed_keys(keys):
+    """Split Steam keys into (revealed, unrevealed) lists in a single pass."""
+    revealed = []
+    unrevealed = []
+    add_revealed = revealed.append
+    add_unrevealed = unrevealed.append
+    for key in keys:
+        if "redeemed_key_val" in key:
+            add_revealed(key)
+        else:
+            # Has not been revealed via Humble yet
+            add_unrevealed(key)
+    return revealed, unrevealed
 
 getHumbleOrders = '''
 var done = arguments[arguments.length - 1];
@@ -722,7 +819,8 @@ var url = arguments[0];
 var csrf = arguments[1];
 var formDataObj = arguments[2];
 
-var formData = new FormData();
+// URL-encoded body (fetch sets the form Content-Type) instead of multipart FormData
+var formData = new URLSearchParams();
 for (const key in formDataObj) {
     formData.append(key, formDataObj[key]);
 }
@@ -744,7 +842,28 @@ fetch(url, {
 });
 '''
 
-def perform_post(driver: webdriver.Remote, url: str, payload: Dict[str, Any], max_retries: int = 3) -> Tuple[int, Dict[str, Any]]:
+# csrf_cookie value per WebDriver session_id, so perform_post skips a driver round-trip
+_csrf_cache = {}
+
+
+def _get_csrf_token(driver):
+    """Return the Humble csrf_cookie value for this driver, read from the browser once."""
+    session_id = getattr(driver, "session_id", None)
+    csrf_value = _csrf_cache.get(session_id)
+    if csrf_value is None:
+        csrf = driver.get_cookie('csrf_cookie')
+        csrf_value = csrf['value'] if csrf is not None else ''
+        if csrf_value:  # Don't cache a missing cookie - login may still set it
+            _csrf_cache[session_id] = csrf_value
+    return csrf_value
+
+
+def _invalidate_csrf_token(driver):
+    """Forget the cached csrf_cookie for this driver; call whenever its Humble cookies change."""
+    _csrf_cache.pop(getattr(driver, "session_id", None), None)
+
+
+def perform_post(driver: 'webdriver.Remote', url: str, payload: Dict[str, Any], max_retries: int = 3) -> Tuple[int, Dict[str, Any]]:
     """
     Perform a POST request via JavaScript fetch in the browser.
     Uses exponential backoff and session refresh on retries.
@@ -767,16 +886,19 @@ def perform_post(driver: webdriver.Remote, url: str, payload: Dict[str, Any], ma
                 if attempt < max_retries - 1:
                     print(f"[DEBUG] Session invalid, refreshing... (attempt {attempt + 1}/{max_retries})")
                     refresh_page_if_needed(driver, "https://www.humblebundle.com/home/library")
+                    _invalidate_csrf_token(driver)
                     time.sleep(DEFAULT_SLEEP_SECONDS)
                 else:
                     raise InvalidSessionIdException("WebDriver session is invalid after retries")
             
-            csrf = driver.get_cookie('csrf_cookie')
-            csrf_value = csrf['value'] if csrf is not None else ''
+            csrf_value = _get_csrf_token(driver)
             
             # Pass data directly as arguments to execute_async_script (prevents JavaScript injection)
             # This is safer than string formatting because arguments are serialized by Selenium
             result = driver.execute_async_script(fetch_cmd, url, csrf_value, payload)
+            if result and result[0] in (401, 403):
+                # Token may have been rotated - read it again next time
+                _invalidate_csrf_token(driver)
             return result
             
         except TimeoutException as e:
@@ -786,7 +908,7 @@ def perform_post(driver: webdriver.Remote, url: str, payload: Dict[str, Any], ma
             # Exponential backoff
             delay = base_delay * (2 ** attempt)
             print(f"[DEBUG] Timeout executing POST to {url}, retrying in {delay}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(delay)
+            interruptible_sleep(delay)
             
         except (InvalidSessionIdException, NoSuchWindowException) as e:
             # Don't retry on session death - it's a permanent error
@@ -799,34 +921,90 @@ def perform_post(driver: webdriver.Remote, url: str, payload: Dict[str, Any], ma
                 raise
             delay = base_delay * (2 ** attempt)
             print(f"[DEBUG] Error executing POST to {url}, retrying in {delay}s... (attempt {attempt + 1}/{max_retries})")
-            time.sleep(delay)
+            interruptible_sleep(delay)
+
+
+def _cached_driver_path(cache_key, install):
+    """
+    Return a webdriver-manager driver path, reusing one resolved recently.
+    
+    webdriver-manager looks up the latest driver version over the network on
+    every install() even when the binary is already downloaded, so the
+    resolved path is cached for DRIVER_PATH_CACHE_HOURS.
+    
+    Args:
+        cache_key: Cache key identifier for this driver/browser combination
+        install: Callable returning a driver path (e.g. ChromeDriverManager().install)
+    """
+    cached_path, is_valid = _load_cache(cache_key, max_age_hours=DRIVER_PATH_CACHE_HOURS)
+    if is_valid and cached_path and os.path.exists(cached_path):
+        return cached_path
+    driver_path = install()
+    _save_cache(cache_key, driver_path)
+    return driver_path
+
+
+def _build_firefox_options(headless, binary_path):
+    """Return FirefoxOptions shared by the webdriver-manager and fallback launches."""
+    from selenium import webdriver
+    options = webdriver.FirefoxOptions()
+    # Return from driver.get() at DOMContentLoaded; we only need the page's origin and cookies
+    options.page_load_strategy = 'eager'
+    if headless:
+        options.add_argument("-headless")
+        # Nobody sees a headless page - skip images (kept when visible for login/CAPTCHA)
+        options.set_preference("permissions.default.image", 2)
+    if binary_path:
+        options.binary_location = binary_path
+    return options
+
+
+def _build_chrome_options(headless, binary_path):
+    """Return ChromeOptions shared by the webdriver-manager and fallback launches."""
+    from selenium import webdriver
+    options = webdriver.ChromeOptions()
+    # Return from driver.get() at DOMContentLoaded; we only need the page's origin and cookies
+    options.page_load_strategy = 'eager'
+    if headless:
+        options.add_argument("--headless=new")
+        # Nobody sees a headless page - skip images (kept when visible for login/CAPTCHA)
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--no-sandbox")
+    # Keep chromedriver/Chrome's own console chatter out of our stderr logger
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    options.add_argument("--log-level=3")
+    
+    # Browser console logs are read via driver.get_log('browser') when diagnosing failures
+    options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+    
+    if binary_path:
+        options.binary_location = binary_path
+    return options
 
 
 def try_firefox_browser(name, binary_path, exceptions, headless=True):
     """Try to create a Firefox browser driver."""
+    from selenium import webdriver
+    from selenium.webdriver.firefox.service import Service as FirefoxService
     driver = None
     if HAS_WEBDRIVER_MANAGER:
         try:
-            options = webdriver.FirefoxOptions()
-            if headless:
-                options.add_argument("-headless")
-            if binary_path:
-                options.binary_location = binary_path
-            service = FirefoxService(GeckoDriverManager().install())
+            options = _build_firefox_options(headless, binary_path)
+            service = FirefoxService(_cached_driver_path("driver_path_firefox", GeckoDriverManager().install))
             driver = webdriver.Firefox(service=service, options=options)
             driver.set_script_timeout(SCRIPT_TIMEOUT_SECONDS)  # Set timeout immediately
             driver.set_page_load_timeout(30)
             process_quit(driver)
             return driver
         except Exception as e:
+            # Cached driver may no longer match an updated browser - resolve again next time
+            _invalidate_cache("driver_path_firefox")
             exceptions.append((f'{name} (webdriver-manager):', str(e)[:200]))
     # Fallback without webdriver-manager
     try:
-        options = webdriver.FirefoxOptions()
-        if headless:
-            options.add_argument("-headless")
-        if binary_path:
-            options.binary_location = binary_path
+        options = _build_firefox_options(headless, binary_path)
         driver = webdriver.Firefox(options=options)
         driver.set_script_timeout(SCRIPT_TIMEOUT_SECONDS)  # Set timeout immediately
         driver.set_page_load_timeout(30)
@@ -839,14 +1017,37 @@ def try_firefox_browser(name, binary_path, exceptions, headless=True):
 
 # Global driver reference for signal handling
 _global_driver = None
-_global_interrupt_event = None
+_global_interrupt_event = threading.Event()  # Set by the signal handler on Ctrl+C/SIGTERM
+_atexit_handler_installed = False  # atexit cleanup is registered once per process
+_signal_handlers_installed = False  # SIGINT/SIGTERM handlers; only installable from the main thread
+
+
+def interruptible_sleep(seconds):
+    """
+    Sleep for up to `seconds`, waking as soon as an interrupt is signalled.
+    
+    Raises:
+        KeyboardInterrupt: If the interrupt event was set before or during the wait
+    """
+    if _global_interrupt_event.wait(seconds):
+        raise KeyboardInterrupt("Interrupted by user")
+
 
 def process_quit(driver, interrupt_event=None):
-    """Register cleanup handlers to quit the driver on exit."""
-    global _global_driver, _global_interrupt_event
+    """
+    Register cleanup handlers to quit the driver on exit.
+    
+    Safe to call for every new driver: the handlers read the current
+    driver/event from module globals, so they are only installed once.
+    Signal handlers can only be set from the main thread; if the first call
+    comes from a worker, a later main-thread call installs them.
+    """
+    global _global_driver, _global_interrupt_event, _atexit_handler_installed, _signal_handlers_installed
     _global_driver = driver
     if interrupt_event:
         _global_interrupt_event = interrupt_event
+    if _atexit_handler_installed and _signal_handlers_installed:
+        return
     
     def quit_on_exit(signum, frame):
         # Suppress urllib3 warnings during cleanup (expected when browser is killed)
@@ -891,63 +1092,84 @@ def process_quit(driver, interrupt_event=None):
         except:
             pass
 
-    atexit.register(quit_on_exit_atexit)
-    signal.signal(signal.SIGTERM, quit_on_exit)
-    signal.signal(signal.SIGINT, quit_on_exit)
+    if not _atexit_handler_installed:
+        atexit.register(quit_on_exit_atexit)
+        _atexit_handler_installed = True
+    # signal.signal() raises ValueError off the main thread
+    if not _signal_handlers_installed and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, quit_on_exit)
+        signal.signal(signal.SIGINT, quit_on_exit)
+        _signal_handlers_installed = True
 
 
 # Browser detection configuration
 # Each entry: (name, type, paths) where type is 'chromium' or 'firefox'
-KNOWN_BROWSERS = [
-    ("Chrome", "chromium", [
+KNOWN_BROWSERS = (
+    ("Chrome", "chromium", (
         "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",  # macOS
         "/usr/bin/google-chrome",  # Linux
         "/usr/bin/google-chrome-stable",  # Linux alternate
         "C:/Program Files/Google/Chrome/Application/chrome.exe",  # Windows
         "C:/Program Files (x86)/Google/Chrome/Application/chrome.exe",  # Windows x86
-    ]),
-    ("Brave", "chromium", [
+    )),
+    ("Brave", "chromium", (
         "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",  # macOS
         "/usr/bin/brave-browser",  # Linux
         "/usr/bin/brave",  # Linux alternate
         "C:/Program Files/BraveSoftware/Brave-Browser/Application/brave.exe",  # Windows
-    ]),
-    ("Edge", "chromium", [
+    )),
+    ("Edge", "chromium", (
         "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",  # macOS
         "/usr/bin/microsoft-edge",  # Linux
         "/usr/bin/microsoft-edge-stable",  # Linux alternate
         "C:/Program Files (x86)/Microsoft/Edge/Application/msedge.exe",  # Windows
         "C:/Program Files/Microsoft/Edge/Application/msedge.exe",  # Windows
-    ]),
-    ("Chromium", "chromium", [
+    )),
+    ("Chromium", "chromium", (
         "/Applications/Chromium.app/Contents/MacOS/Chromium",  # macOS
         "/usr/bin/chromium",  # Linux
         "/usr/bin/chromium-browser",  # Linux alternate
         "/snap/bin/chromium",  # Linux snap
         "C:/Program Files/Chromium/Application/chrome.exe",  # Windows
-    ]),
-    ("Opera", "chromium", [
+    )),
+    ("Opera", "chromium", (
         "/Applications/Opera.app/Contents/MacOS/Opera",  # macOS
         "/usr/bin/opera",  # Linux
         "C:/Program Files/Opera/launcher.exe",  # Windows
-    ]),
-    ("Vivaldi", "chromium", [
+    )),
+    ("Vivaldi", "chromium", (
         "/Applications/Vivaldi.app/Contents/MacOS/Vivaldi",  # macOS
         "/usr/bin/vivaldi",  # Linux
         "/usr/bin/vivaldi-stable",  # Linux alternate
         "C:/Program Files/Vivaldi/Application/vivaldi.exe",  # Windows
-    ]),
-    ("Arc", "chromium", [
+    )),
+    ("Arc", "chromium", (
         "/Applications/Arc.app/Contents/MacOS/Arc",  # macOS
-    ]),
-    ("Firefox", "firefox", [
+    )),
+    ("Firefox", "firefox", (
         "/Applications/Firefox.app/Contents/MacOS/firefox",  # macOS
         "/usr/bin/firefox",  # Linux
         "/snap/bin/firefox",  # Linux snap
         "C:/Program Files/Mozilla Firefox/firefox.exe",  # Windows
         "C:/Program Files (x86)/Mozilla Firefox/firefox.exe",  # Windows x86
-    ]),
-]
+    )),
+)
+
+
+def _is_current_os_path(path):
+    """Return True if a KNOWN_BROWSERS path belongs to the OS we're running on."""
+    if sys.platform == "win32":
+        return path[1:3] == ":/"  # Drive-letter paths
+    if sys.platform == "darwin":
+        return path.startswith("/Applications/")
+    return path.startswith("/") and not path.startswith("/Applications/")
+
+
+# KNOWN_BROWSERS narrowed to this OS's paths once at import
+_BROWSERS_FOR_OS = tuple(
+    (name, browser_type, tuple(path for path in paths if _is_current_os_path(path)))
+    for name, browser_type, paths in KNOWN_BROWSERS
+)
 
 
 def detect_browsers():
@@ -960,8 +1182,8 @@ def detect_browsers():
         browser_type = os.environ.get("BROWSER_TYPE", "chromium")
         detected.append(("Custom", browser_type, custom_path))
     
-    # Scan for known browsers
-    for name, browser_type, paths in KNOWN_BROWSERS:
+    # Scan for known browsers (only probe paths for this OS)
+    for name, browser_type, paths in _BROWSERS_FOR_OS:
         for path in paths:
             if os.path.exists(path):
                 detected.append((name, browser_type, path))
@@ -972,22 +1194,14 @@ def detect_browsers():
 
 def try_chromium_browser(name, binary_path, exceptions, headless=True):
     """Try to create a Chromium-based browser driver."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service as ChromeService
     driver = None
 
     if HAS_WEBDRIVER_MANAGER:
+        driver_cache_key = None
         try:
-            options = webdriver.ChromeOptions()
-            if headless:
-                options.add_argument("--headless=new")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--no-sandbox")
-            
-            # Enable logging for debugging
-            options.set_capability('goog:loggingPrefs', {'browser': 'ALL', 'performance': 'ALL'})
-            
-            if binary_path:
-                options.binary_location = binary_path
+            options = _build_chrome_options(headless, binary_path)
             
             # Use appropriate ChromeType for known browsers
             if "brave" in name.lower():
@@ -997,29 +1211,24 @@ def try_chromium_browser(name, binary_path, exceptions, headless=True):
             else:
                 chrome_type = ChromeType.GOOGLE
             
-            service = ChromeService(ChromeDriverManager(chrome_type=chrome_type).install())
+            driver_cache_key = f"driver_path_{chrome_type}"
+            service = ChromeService(_cached_driver_path(
+                driver_cache_key, ChromeDriverManager(chrome_type=chrome_type).install
+            ))
             driver = webdriver.Chrome(service=service, options=options)
             driver.set_script_timeout(SCRIPT_TIMEOUT_SECONDS)
             driver.set_page_load_timeout(30)
             process_quit(driver)
             return driver
         except Exception as e:
+            # Cached driver may no longer match an updated browser - resolve again next time
+            if driver_cache_key:
+                _invalidate_cache(driver_cache_key)
             exceptions.append((f'{name} (webdriver-manager):', str(e)[:200]))
     
     # Fallback without webdriver-manager
     try:
-        options = webdriver.ChromeOptions()
-        if headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--no-sandbox")
-        
-        # Enable logging
-        options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
-        
-        if binary_path:
-            options.binary_location = binary_path
+        options = _build_chrome_options(headless, binary_path)
         driver = webdriver.Chrome(options=options)
         driver.set_script_timeout(SCRIPT_TIMEOUT_SECONDS)
         driver.set_page_load_timeout(30)
@@ -1119,224 +1328,309 @@ def prompt_mode(order_details,humble_session):
 def valid_steam_key(key):
     """Validate Steam key format (XXXXX-XXXXX-XXXXX)."""
     # Steam keys are in the format of AAAAA-BBBBB-CCCCC
-    if not isinstance(key, str):
-        return False
-    key_parts = key.split("-")
+    # Length and dash positions reject most non-keys before the regex runs
     return (
-        len(key) == 17
-        and len(key_parts) == 3
-        and all(len(part) == 5 for part in key_parts)
+        isinstance(key, str)
+        and len(key) == 17
+        and key[5] == '-'
+        and key[11] == '-'
+        and STEAM_KEY_PATTERN.fullmatch(key) is not None
     )
 
 
+# Friend/co-op key detection patterns (lowercase; see is_friend_or_coop_key)
+# High confidence patterns (definitely friend keys)
+FRIEND_KEY_HIGH_CONFIDENCE_PATTERNS = (
+    'friend pass', 'friends pass', 'friend\'s pass',
+    'guest pass', 'guest key', 'guest access',
+    'extra copy', 'bonus copy',
+    'co-op pass', 'coop pass', 'co op pass',
+)
+
+# Medium confidence patterns (probably friend keys)
+FRIEND_KEY_MEDIUM_CONFIDENCE_PATTERNS = (
+    'friend key', 'friends key', 'friend\'s key',
+    'multiplayer pass', 'multi-player pass',
+    'companion pass',
+    'invite key', 'invitation key', 'invite pass',
+    'additional copy', 'additional key',
+    '2-pack', '3-pack', '4-pack',  # Multi-packs often have extra copies
+    '2 pack', '3 pack', '4 pack',
+    'gift copy', 'giftable copy', 'gift key',
+    'buddy pass', 'buddy key',
+    'spare copy', 'spare key',
+)
+
+# Low confidence patterns (might be friend keys)
+FRIEND_KEY_LOW_CONFIDENCE_PATTERNS = (
+    'extra', 'bonus', 'additional',
+)
+
+# Exact match patterns (must match exactly, not substring)
+FRIEND_KEY_EXACT_MATCH_PATTERNS = (
+    'extra',  # Too generic as substring
+    'bonus',  # Too generic as substring
+)
+
+# Common suffixes indicating friend keys
+FRIEND_KEY_SUFFIX_PATTERNS = (
+    ' - extra', ' (extra)', '[extra]',
+    ' - friend', ' (friend)', '[friend]',
+    ' - guest', ' (guest)', '[guest]',
+    ' - gift', ' (gift)', '[gift]',
+)
+
+# Specific known games with friend keys
+KNOWN_FRIEND_GAMES = (
+    'minion masters',  # Known for friend keys
+    'dont starve together',  # Has friend copies
+    "don't starve together",  # Alternate spelling
+    'portal 2',  # Has extra copy
+    'serious sam',  # Multiple friend keys
+    'dead island',  # Has guest passes
+    'killing floor',  # Has guest passes
+    'castle crashers',  # Has extra copies
+    'battleblock theater',  # Has extra copies
+    'counter-strike',  # Has guest passes
+    'half-life 2',  # Has guest passes
+    'dead by daylight - stranger things',  # Friend pass DLC
+    'insurgency',  # Has extra copies in bundles
+    'arma',  # Often includes friend passes
+)
+
+# DLC/Content that shouldn't be auto-redeemed
+NON_GAME_CONTENT = (
+    'soundtrack', 'ost', 'original soundtrack',
+    'artbook', 'art book',
+    'digital comic', 'comic book',
+    'wallpaper', 'avatar', 'badge',
+)
+
+
+FRIEND_KEY_EXCLUSIONS_FILE = "friend_key_exclusions.txt"
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_friend_key_exclusions(file_signature):
+    """
+    Parse friend_key_exclusions.txt into (high, medium, low, exact) pattern tuples
+    that already include the built-in patterns.
+    
+    file_signature is the file's (mtime_ns, size), or None when it doesn't exist; it is
+    only used as the cache key, so the file is re-read only after it changes.
+    """
+    high = list(FRIEND_KEY_HIGH_CONFIDENCE_PATTERNS)
+    medium = list(FRIEND_KEY_MEDIUM_CONFIDENCE_PATTERNS)
+    low = list(FRIEND_KEY_LOW_CONFIDENCE_PATTERNS)
+    exact = list(FRIEND_KEY_EXACT_MATCH_PATTERNS)
+    
+    if file_signature is not None:
+        tiers = {"HIGH": high, "MEDIUM": medium, "LOW": low, "EXACT": exact}
+        try:
+            with open(FRIEND_KEY_EXCLUSIONS_FILE, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        # Format: "pattern" or "HIGH:pattern" or "MEDIUM:pattern" or "LOW:pattern" or "EXACT:pattern"
+                        if ":" in line:
+                            prefix, pattern = line.split(":", 1)
+                            # Unknown prefixes default to medium confidence
+                            tiers.get(prefix.strip().upper(), medium).append(pattern.strip().lower())
+                        else:
+                            # Default to medium confidence for custom patterns
+                            medium.append(line.lower())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[DEBUG] Error loading {FRIEND_KEY_EXCLUSIONS_FILE}: {e}")
+    
+    return tuple(high), tuple(medium), tuple(low), tuple(exact)
+
+
+def _load_friend_key_patterns():
+    """Return the (high, medium, low, exact) friend-key pattern tiers, re-parsing the exclusions file only when it changes."""
+    try:
+        st = os.stat(FRIEND_KEY_EXCLUSIONS_FILE)
+        file_signature = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        file_signature = None
+    return _parse_friend_key_exclusions(file_signature)
+
+
+@functools.lru_cache(maxsize=None)
+def _any_pattern_regex(patterns, whole_word=False):
+    """Compile (once per pattern tuple) a regex matching any of the patterns."""
+    alternation = '|'.join(re.escape(pattern) for pattern in patterns)
+    if whole_word:
+        return re.compile(r'\b(?:' + alternation + r')\b')
+    return re.compile(alternation)
+
+
+@functools.lru_cache(maxsize=None)
+def _word_boundary_regex(pattern):
+    """Compile (once per pattern) a regex matching pattern as a whole word."""
+    return re.compile(r'\b' + re.escape(pattern) + r'\b')
+
+
 def is_friend_or_coop_key(key, confidence_threshold=0.8):
     """
     Detect if a key is a friend/co-op pass that should not be redeemed.
     Returns (is_friend_key, reason, confidence) tuple.
     Confidence: 1.0 = certain, 0.5-0.99 = likely, <0.5 = uncertain
     """
-    import re
-    
-    # High confidence patterns (definitely friend keys)
-    HIGH_CONFIDENCE_PATTERNS = [
-        'friend pass', 'friends pass', 'friend\'s pass',
-        'guest pass', 'guest key', 'guest access',
-        'extra copy', 'bonus copy',
-        'co-op pass', 'coop pass', 'co op pass',
-    ]
-    
-    # Medium confidence patterns (probably friend keys)
-    MEDIUM_CONFIDENCE_PATTERNS = [
-        'friend key', 'friends key', 'friend\'s key',
-        'multiplayer pass', 'multi-player pass',
-        'companion pass',
-        'invite key', 'invitation key', 'invite pass',
-        'additional copy', 'additional key',
-        '2-pack', '3-pack', '4-pack',  # Multi-packs often have extra copies
-        '2 pack', '3 pack', '4 pack',
-        'gift copy', 'giftable copy', 'gift key',
-        'buddy pass', 'buddy key',
-        'spare copy', 'spare key',
-    ]
-    
-    # Low confidence patterns (might be friend keys)
-    LOW_CONFIDENCE_PATTERNS = [
-        'extra', 'bonus', 'additional',
-    ]
-    
-    # Exact match patterns (must match exactly, not substring)
-    EXACT_MATCH_PATTERNS = [
-        'extra',  # Too generic as substring
-        'bonus',  # Too generic as substring
-    ]
-    
-    # Common suffixes indicating friend keys
-    SUFFIX_PATTERNS = [
-        ' - extra', ' (extra)', '[extra]',
-        ' - friend', ' (friend)', '[friend]',
-        ' - guest', ' (guest)', '[guest]',
-        ' - gift', ' (gift)', '[gift]',
-    ]
-    
-    # Specific known games with friend keys
-    KNOWN_FRIEND_GAMES = [
-        'minion masters',  # Known for friend keys
-        'dont starve together',  # Has friend copies
-        "don't starve together",  # Alternate spelling
-        'portal 2',  # Has extra copy
-        'serious sam',  # Multiple friend keys
-        'dead island',  # Has guest passes
-        'killing floor',  # Has guest passes
-        'castle crashers',  # Has extra copies
-        'battleblock theater',  # Has extra copies
-        'counter-strike',  # Has guest passes
-        'half-life 2',  # Has guest passes
-        'dead by daylight - stranger things',  # Friend pass DLC
-        'insurgency',  # Has extra copies in bundles
-        'arma',  # Often includes friend passes
-    ]
-    
-    # DLC/Content that shouldn't be auto-redeemed
-    NON_GAME_CONTENT = [
-        'soundtrack', 'ost', 'original soundtrack',
-        'artbook', 'art book',
-        'digital comic', 'comic book',
-        'wallpaper', 'avatar', 'badge',
-    ]
-    
-    # Load custom patterns with confidence levels
-    try:
-        with open("friend_key_exclusions.txt", "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    # Format: "pattern" or "HIGH:pattern" or "MEDIUM:pattern" or "LOW:pattern" or "EXACT:pattern"
-                    if ":" in line:
-                        prefix, pattern = line.split(":", 1)
-                        prefix = prefix.strip().upper()
-                        pattern = pattern.strip().lower()
-                        if prefix == "HIGH":
-                            HIGH_CONFIDENCE_PATTERNS.append(pattern)
-                        elif prefix == "MEDIUM":
-                            MEDIUM_CONFIDENCE_PATTERNS.append(pattern)
-                        elif prefix == "LOW":
-                            LOW_CONFIDENCE_PATTERNS.append(pattern)
-                        elif prefix == "EXACT":
-                            EXACT_MATCH_PATTERNS.append(pattern)
-                        else:
-                            # Default to medium confidence for custom patterns
-                            MEDIUM_CONFIDENCE_PATTERNS.append(pattern)
-                    else:
-                        # Default to medium confidence for custom patterns
-                        MEDIUM_CONFIDENCE_PATTERNS.append(line.lower())
-    except FileNotFoundError:
-        pass
-    except Exception as e:
-        print(f"[DEBUG] Error loading friend_key_exclusions.txt: {e}")
+    # Built-in tiers plus any custom patterns from friend_key_exclusions.txt
+    (HIGH_CONFIDENCE_PATTERNS, MEDIUM_CONFIDENCE_PATTERNS,
+     LOW_CONFIDENCE_PATTERNS, EXACT_MATCH_PATTERNS) = _load_friend_key_patterns()
     
     # Fields to check
     human_name = key.get('human_name', '').lower()
     machine_name = key.get('machine_name', '').lower()
     key_type = key.get('key_type_human_name', '').lower()
     
+    # Each tier is first checked with one combined regex over all fields joined by a
+    # separator no pattern contains, which rejects the common no-match case in a
+    # single scan; the per-pattern loop only runs on a hit, so the reported
+    # pattern/field is the same as checking patterns in order
+    haystack = f"{human_name}\x1f{machine_name}\x1f{key_type}"
+    names_end = len(human_name) + 1 + len(machine_name)  # End of the human/machine part
+    
     # Check high confidence patterns first
-    for pattern in HIGH_CONFIDENCE_PATTERNS:
-        if pattern in human_name:
-            return True, f"human_name contains '{pattern}'", 1.0
-        if pattern in machine_name:
-            return True, f"machine_name contains '{pattern}'", 1.0
-        if pattern in key_type:
-            return True, f"key_type contains '{pattern}'", 1.0
-    
-    # Check suffix patterns (high confidence)
-    for pattern in SUFFIX_PATTERNS:
-        if human_name.endswith(pattern):
-            return True, f"human_name ends with '{pattern}'", 1.0
-        if machine_name.endswith(pattern):
-            return True, f"machine_name ends with '{pattern}'", 1.0
+    high_regex = _any_pattern_regex(HIGH_CONFIDENCE_PATTERNS)
+    if high_regex.search(haystack):
+        for pattern in HIGH_CONFIDENCE_PATTERNS:
+            if pattern in human_name:
+                return True, f"human_name contains '{pattern}'", 1.0
+            if pattern in machine_name:
+                return True, f"machine_name contains '{pattern}'", 1.0
+            if pattern in key_type:
+                return True, f"key_type contains '{pattern}'", 1.0
+    
+    # Check suffix patterns (high confidence); endswith() takes the whole tuple at once
+    if human_name.endswith(FRIEND_KEY_SUFFIX_PATTERNS) or machine_name.endswith(FRIEND_KEY_SUFFIX_PATTERNS):
+        for pattern in FRIEND_KEY_SUFFIX_PATTERNS:
+            if human_name.endswith(pattern):
+                return True, f"human_name ends with '{pattern}'", 1.0
+            if machine_name.endswith(pattern):
+                return True, f"machine_name ends with '{pattern}'", 1.0
     
     # Check known friend games (medium-high confidence)
-    for pattern in KNOWN_FRIEND_GAMES:
-        if pattern in human_name:
-            return True, f"known friend game: '{pattern}'", 0.85
-        if pattern in machine_name:
-            return True, f"known friend game: '{pattern}'", 0.85
+    known_regex = _any_pattern_regex(KNOWN_FRIEND_GAMES)
+    if known_regex.search(haystack, 0, names_end):
+        for pattern in KNOWN_FRIEND_GAMES:
+            if pattern in human_name:
+                return True, f"known friend game: '{pattern}'", 0.85
+            if pattern in machine_name:
+                return True, f"known friend game: '{pattern}'", 0.85
     
     # Check medium confidence patterns
-    for pattern in MEDIUM_CONFIDENCE_PATTERNS:
-        if pattern in human_name:
-            return True, f"human_name contains '{pattern}'", 0.75
-        if pattern in machine_name:
-            return True, f"machine_name contains '{pattern}'", 0.75
-        if pattern in key_type:
-            return True, f"key_type contains '{pattern}'", 0.75
+    medium_regex = _any_pattern_regex(MEDIUM_CONFIDENCE_PATTERNS)
+    if medium_regex.search(haystack):
+        for pattern in MEDIUM_CONFIDENCE_PATTERNS:
+            if pattern in human_name:
+                return True, f"human_name contains '{pattern}'", 0.75
+            if pattern in machine_name:
+                return True, f"machine_name contains '{pattern}'", 0.75
+            if pattern in key_type:
+                return True, f"key_type contains '{pattern}'", 0.75
     
     # Check non-game content (medium confidence)
-    for pattern in NON_GAME_CONTENT:
-        if pattern in human_name:
-            return True, f"non-game content: '{pattern}'", 0.7
-        if pattern in machine_name:
-            return True, f"non-game content: '{pattern}'", 0.7
+    non_game_regex = _any_pattern_regex(NON_GAME_CONTENT)
+    if non_game_regex.search(haystack, 0, names_end):
+        for pattern in NON_GAME_CONTENT:
+            if pattern in human_name:
+                return True, f"non-game content: '{pattern}'", 0.7
+            if pattern in machine_name:
+                return True, f"non-game content: '{pattern}'", 0.7
     
     # Check low confidence patterns with word boundaries
-    for pattern in LOW_CONFIDENCE_PATTERNS:
-        pattern_regex = r'\b' + re.escape(pattern) + r'\b'
-        if re.search(pattern_regex, human_name):
-            return True, f"human_name contains '{pattern}' (low confidence)", 0.5
-        if re.search(pattern_regex, machine_name):
-            return True, f"machine_name contains '{pattern}' (low confidence)", 0.5
-        if re.search(pattern_regex, key_type):
-            return True, f"key_type contains '{pattern}' (low confidence)", 0.5
+    low_regex = _any_pattern_regex(LOW_CONFIDENCE_PATTERNS, whole_word=True)
+    if low_regex.search(haystack):
+        for pattern in LOW_CONFIDENCE_PATTERNS:
+            pattern_regex = _word_boundary_regex(pattern)
+            if pattern_regex.search(human_name):
+                return True, f"human_name contains '{pattern}' (low confidence)", 0.5
+            if pattern_regex.search(machine_name):
+                return True, f"machine_name contains '{pattern}' (low confidence)", 0.5
+            if pattern_regex.search(key_type):
+                return True, f"key_type contains '{pattern}' (low confidence)", 0.5
     
     # Check exact match patterns (word boundaries)
-    for pattern in EXACT_MATCH_PATTERNS:
-        pattern_regex = r'\b' + re.escape(pattern) + r'\b'
-        if re.search(pattern_regex, human_name):
-            return True, f"human_name exactly matches '{pattern}'", 0.6
-        if re.search(pattern_regex, machine_name):
-            return True, f"machine_name exactly matches '{pattern}'", 0.6
-        if re.search(pattern_regex, key_type):
-            return True, f"key_type exactly matches '{pattern}'", 0.6
+    exact_regex = _any_pattern_regex(EXACT_MATCH_PATTERNS, whole_word=True)
+    if exact_regex.search(haystack):
+        for pattern in EXACT_MATCH_PATTERNS:
+            pattern_regex = _word_boundary_regex(pattern)
+            if pattern_regex.search(human_name):
+                return True, f"human_name exactly matches '{pattern}'", 0.6
+            if pattern_regex.search(machine_name):
+                return True, f"machine_name exactly matches '{pattern}'", 0.6
+            if pattern_regex.search(key_type):
+                return True, f"key_type exactly matches '{pattern}'", 0.6
     
     return False, "", 0.0
 
 
-def save_friend_key(key, reason="", confidence=1.0):
-    """Save friend/co-op keys to a separate CSV for gifting with enhanced metadata."""
-    filename = CSVFiles.FRIEND_KEYS
+# (gamekey, lowercased human_name) pairs already in the friend keys CSV; loaded on first save
+_seen_friend_keys = None
+
+
+def save_friend_keys(friend_keys):
+    """
+    Save friend/co-op keys to a separate CSV for gifting with enhanced metadata.
     
-    # Check if we need to write header
-    file_needs_header = not os.path.exists(filename) or os.path.getsize(filename) == 0
+    Args:
+        friend_keys: Iterable of (key, reason, confidence) tuples; all new rows are
+            written with a single open of the CSV
+    """
+    global _seen_friend_keys
+    filename = CSVFiles.FRIEND_KEYS
     
-    # Check for duplicates before writing
-    if os.path.exists(filename):
-        try:
-            with open(filename, "r", encoding="utf-8-sig") as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 4:
-                        existing_gamekey = row[3].strip()
-                        existing_name = row[0].strip().lower()
-                        if existing_gamekey == key.get('gamekey', '') and existing_name == key.get('human_name', '').lower():
-                            # Duplicate found - skip writing
-                            return
-        except Exception:
-            pass
+    # Check if we need to write header (one stat instead of exists() + getsize())
+    try:
+        file_needs_header = os.stat(filename).st_size == 0
+    except OSError:
+        file_needs_header = True
+    
+    # Read the existing rows once; later saves check duplicates against the set
+    if _seen_friend_keys is None:
+        _seen_friend_keys = set()
+        if not file_needs_header:
+            try:
+                with open(filename, "r", encoding=CSV_ENCODING, newline='') as f:
+                    for row in csv.reader(f):
+                        if len(row) >= 4:
+                            _seen_friend_keys.add((row[3].strip(), row[0].strip().lower()))
+            except Exception:
+                pass
     
-    with open(filename, "a", encoding="utf-8-sig", newline='') as f:
-        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
-        if file_needs_header:
-            writer.writerow(["human_name", "key_type", "redeemed_key_val", "gamekey", "steam_app_id", "reason", "confidence"])
-        writer.writerow([
-            key.get('human_name', ''),
+    rows = []
+    new_seen_keys = set()
+    for key, reason, confidence in friend_keys:
+        human_name = key.get('human_name', '')
+        gamekey = key.get('gamekey', '')
+        seen_key = (gamekey, human_name.lower())
+        if seen_key in _seen_friend_keys or seen_key in new_seen_keys:
+            # Duplicate found - skip writing
+            continue
+        new_seen_keys.add(seen_key)
+        rows.append([
+            human_name,
             key.get('key_type_human_name', 'Unknown'),
             key.get('redeemed_key_val', 'NOT_REVEALED'),
-            key.get('gamekey', ''),
+            gamekey,
             key.get('steam_app_id', ''),
             reason,
             f"{int(confidence * 100)}%"
         ])
-        f.flush()
+    
+    if not rows:
+        return
+    
+    with open(filename, "a", encoding=CSV_ENCODING, newline='') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+        if file_needs_header:
+            writer.writerow(["human_name", "key_type", "redeemed_key_val", "gamekey", "steam_app_id", "reason", "confidence"])
+        writer.writerows(rows)
+    _seen_friend_keys.update(new_seen_keys)
 
 
 def review_uncertain_friend_keys(uncertain_keys):
@@ -1377,7 +1671,7 @@ def review_uncertain_friend_keys(uncertain_keys):
 
 def create_sample_friend_exclusions():
     """Create a sample friend_key_exclusions.txt if it doesn't exist."""
-    filename = "friend_key_exclusions.txt"
+    filename = FRIEND_KEY_EXCLUSIONS_FILE
     if os.path.exists(filename):
         return  # Don't overwrite existing file
     
@@ -1437,10 +1731,14 @@ class SecureCookieManager:
     - Persistent key storage (for auto-mode)
     """
     
+    __slots__ = ("key_file", "cipher", "encryption_enabled", "_loaded_cookies")
+    
     def __init__(self):
         self.key_file = Path(".cookie_encryption_key")
         self.cipher = None
         self.encryption_enabled = HAS_ENCRYPTION
+        # Cookie file path -> ((mtime_ns, size), cookies) from its last successful load
+        self._loaded_cookies = {}
         
         if not HAS_ENCRYPTION:
             # Silent fallback - don't spam console in auto-mode
@@ -1487,9 +1785,12 @@ class SecureCookieManager:
             bool: True if successful
         """
         cookie_path = Path(cookie_file) if not isinstance(cookie_file, Path) else cookie_file
+        # Written first and swapped in, so an interrupted write never leaves a
+        # truncated cookie file that fails to load on the next run
+        temp_path = cookie_path.with_name(cookie_path.name + ".tmp")
         
         try:
-            pickled = pickle.dumps(cookies)
+            pickled = pickle.dumps(cookies, protocol=pickle.HIGHEST_PROTOCOL)
             
             if self.encryption_enabled and self.cipher:
                 # Encrypt the cookies
@@ -1500,17 +1801,23 @@ class SecureCookieManager:
                 # Fallback to unencrypted (backward compatible)
                 data = pickled
             
-            with cookie_path.open("wb") as f:
+            with temp_path.open("wb") as f:
                 f.write(data)
             
-            # Set restrictive permissions
+            # Set restrictive permissions before the file replaces the old one
             try:
-                cookie_path.chmod(0o600)
+                temp_path.chmod(0o600)
             except (OSError, AttributeError):
                 pass  # chmod not available on Windows
             
+            os.replace(temp_path, cookie_path)
+            self._loaded_cookies.pop(str(cookie_path), None)
             return True
         except Exception as e:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
             print(f"[DEBUG] Failed to save cookies to {cookie_file}: {e}")
             return False
     
@@ -1526,9 +1833,17 @@ class SecureCookieManager:
         """
         cookie_path = Path(cookie_file) if not isinstance(cookie_file, Path) else cookie_file
         
-        if not cookie_path.exists():
+        try:
+            st = cookie_path.stat()
+        except OSError:
             return None
         
+        # Skip the read/decrypt/unpickle when the file hasn't changed since the last load
+        file_signature = (st.st_mtime_ns, st.st_size)
+        cached = self._loaded_cookies.get(str(cookie_path))
+        if cached is not None and cached[0] == file_signature:
+            return cached[1]
+        
         try:
             with cookie_path.open("rb") as f:
                 data = f.read()
@@ -1559,19 +1874,24 @@ class SecureCookieManager:
                     self.save_cookies(cookie_file, cookies)
                     return cookies
             
-            return pickle.loads(pickled)
+            cookies = pickle.loads(pickled)
+            self._loaded_cookies[str(cookie_path)] = (file_signature, cookies)
+            return cookies
         except Exception as e:
             print(f"[DEBUG] Failed to load cookies from {cookie_file}: {e}")
             return None
 
 # Global cookie manager instance
 _cookie_manager = None
+_cookie_manager_lock = threading.Lock()  # Ensures only one manager (and key file) is ever created
 
 def get_cookie_manager():
     """Get or create the global cookie manager instance."""
     global _cookie_manager
     if _cookie_manager is None:
-        _cookie_manager = SecureCookieManager()
+        with _cookie_manager_lock:
+            if _cookie_manager is None:
+                _cookie_manager = SecureCookieManager()
     return _cookie_manager
 
 
@@ -1584,7 +1904,7 @@ def try_recover_cookies(cookie_file, session):
         return False
     
     try:
-        if type(session) is requests.Session:
+        if isinstance(session, requests.Session):
             # handle Steam session
             session.cookies.update(cookies)
         else:
@@ -1595,6 +1915,8 @@ def try_recover_cookies(cookie_file, session):
                 except Exception:
                     # Skip invalid cookies
                     pass
+            # The restored cookies may carry a different csrf_cookie
+            _invalidate_csrf_token(session)
         return True
     except Exception as e:
         print(f"[DEBUG] Failed to apply cookies from {cookie_file}: {e}")
@@ -1612,7 +1934,7 @@ def export_cookies(cookie_file, session):
     """
     try:
         cookies = None
-        if type(session) is requests.Session:
+        if isinstance(session, requests.Session):
             # handle Steam session
             cookies = session.cookies
         else:
@@ -1633,7 +1955,7 @@ fetch("https://www.humblebundle.com/home/library").then(r => {done(!r.redirected
 
 def verify_logins_session(session):
     """Verify login status for Humble and/or Steam. Returns [humble_status, steam_status]."""
-    if type(session) is requests.Session:
+    if isinstance(session, requests.Session):
         loggedin = session.get(STEAM_KEYS_PAGE, allow_redirects=False).status_code not in (301,302)
         return [False,loggedin]
     else:
@@ -1647,7 +1969,7 @@ def verify_logins_session(session):
             print(f"[DEBUG] Error verifying login: {e}")
             return [False, False]
 
-def do_login(driver: webdriver.Remote, payload: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+def do_login(driver: 'webdriver.Remote', payload: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
     """
     Perform login POST request via browser.
     
@@ -1814,7 +2136,6 @@ def humble_login(driver, is_headless=True):
             except Exception as e:
                 print(f"[DEBUG] 2FA submission failed: {e}")
                 print(f"[DEBUG] Exception type: {type(e).__name__}")
-                import traceback
                 traceback.print_exc()
                 # Only switch to visible browser if we're currently headless
                 if is_headless:
@@ -1823,6 +2144,7 @@ def humble_login(driver, is_headless=True):
                     driver = get_browser_driver(headless=False)
                 return humble_login_manual(driver), True
 
+        _invalidate_csrf_token(driver)  # Login issued a new csrf_cookie
         export_cookies(".humblecookies", driver)
         return driver, True
 
@@ -1858,6 +2180,7 @@ def humble_login_manual(driver):
     if "login" in driver.current_url.lower():
         print("Login verification failed - still on login page. Please try again.")
         return humble_login_manual(driver)  # Retry
+    _invalidate_csrf_token(driver)  # Login issued a new csrf_cookie
     export_cookies(".humblecookies", driver)
     return driver
 
@@ -1887,6 +2210,8 @@ def steam_login():
         print("="*60)
         sys.exit(2)  # Exit code 2 = stale cookies
     # Prompt user to sign in.
+    import steam.webauth as wa
+    wa.getpass = pwinput  # Patch steam webauth for password feedback
     s_username = input("Steam Username: ")
     user = wa.WebAuth(s_username)
     try:
@@ -1905,19 +2230,22 @@ def steam_login():
         else:
             print(f"Error logging into Steam (KeyError): {e}")
         print("Please try again.")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
     except Exception as e:
         print(f"Error logging into Steam: {e}")
         print(f"Exception type: {type(e).__name__}")
         print("Please try again.")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
 
-def redeem_humble_key(sess: webdriver.Remote, tpk: Dict[str, Any], max_retries: int = 3) -> str:
+def _retry_backoff_seconds(attempt: int, base_delay: float) -> float:
+    """Exponential backoff for retry `attempt` (0-based), capped and with jitter."""
+    return min(RETRY_BACKOFF_MAX_SECONDS, base_delay * (2 ** attempt)) + random.uniform(0, RETRY_BACKOFF_JITTER_SECONDS)
+
+
+def redeem_humble_key(sess: 'webdriver.Remote', tpk: Dict[str, Any], max_retries: int = 3) -> str:
     """
     Redeem a key on Humble Bundle to reveal the actual Steam key.
     
@@ -1944,7 +2272,7 @@ def redeem_humble_key(sess: webdriver.Remote, tpk: Dict[str, Any], max_retries:
                 if not refresh_page_if_needed(sess, "https://www.humblebundle.com/home/library"):
                     if attempt < max_retries - 1:
                         print(f"  -> Recovery failed, retrying... (attempt {attempt + 2}/{max_retries})")
-                        time.sleep(DEFAULT_SLEEP_SECONDS)
+                        interruptible_sleep(_retry_backoff_seconds(attempt, DEFAULT_SLEEP_SECONDS))
                         continue
                     print(f"  -> Failed to recover session for {tpk['human_name']}")
                     return ""
@@ -1956,7 +2284,7 @@ def redeem_humble_key(sess: webdriver.Remote, tpk: Dict[str, Any], max_retries:
                 print(f"  -> HTTP {status} while redeeming {tpk['human_name']}")
                 if attempt < max_retries - 1:
                     print(f"  -> Retrying... (attempt {attempt + 2}/{max_retries})")
-                    time.sleep(DEFAULT_SLEEP_SECONDS)
+                    interruptible_sleep(_retry_backoff_seconds(attempt, DEFAULT_SLEEP_SECONDS))
                     continue
                 return ""
             
@@ -1965,7 +2293,7 @@ def redeem_humble_key(sess: webdriver.Remote, tpk: Dict[str, Any], max_retries:
                 print(f"  -> Error redeeming key: {error_msg}")
                 
                 # Check for expired key - return as string, will be converted to enum in write_key
-                if "expired" in error_msg.lower():
+                if EXPIRED_ERROR_PATTERN.search(error_msg):
                     return "EXPIRED"  # String value, converted to SteamErrorCode.EXPIRED in write_key()
                 
                 # Don't retry on explicit errors from Humble
@@ -1980,7 +2308,7 @@ def redeem_humble_key(sess: webdriver.Remote, tpk: Dict[str, Any], max_retries:
         except TimeoutException:
             print(f"  -> Timeout (attempt {attempt + 1}/{max_retries})")
             if attempt < max_retries - 1:
-                time.sleep(LONG_SLEEP_SECONDS)
+                interruptible_sleep(_retry_backoff_seconds(attempt, LONG_SLEEP_SECONDS))
                 continue
             return ""
             
@@ -1993,9 +2321,9 @@ def redeem_humble_key(sess: webdriver.Remote, tpk: Dict[str, Any], max_retries:
                 print(f"  -> Attempting to recover session...")
                 try:
                     sess.get("https://www.humblebundle.com/home/library")
-                    time.sleep(LONG_SLEEP_SECONDS)
                 except:
                     pass
+                interruptible_sleep(_retry_backoff_seconds(attempt, LONG_SLEEP_SECONDS))
                 continue
             # Return empty string to indicate failure - caller will handle recovery
             return ""
@@ -2006,22 +2334,71 @@ def redeem_humble_key(sess: webdriver.Remote, tpk: Dict[str, Any], max_retries:
             print(f"  -> {error_type}: {error_msg}")
             if attempt < max_retries - 1:
                 print(f"  -> Retrying... (attempt {attempt + 2}/{max_retries})")
-                time.sleep(DEFAULT_SLEEP_SECONDS)
+                interruptible_sleep(_retry_backoff_seconds(attempt, DEFAULT_SLEEP_SECONDS))
                 continue
             return ""
     
     return ""
 
+def get_humble_requests_session(driver):
+    """
+    Build a requests session carrying the browser's Humble cookies.
+    
+    The session keeps a pooled keep-alive connection to Humble so repeated
+    Choice month fetches skip the TCP/TLS handshake, and retries transient
+    server errors with a short backoff.
+    
+    Args:
+        driver: WebDriver instance with a logged-in Humble session
+        
+    Returns:
+        Configured requests.Session
+    """
+    request_session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=HUMBLE_HTTP_POOL_SIZE,
+        # No 429 here: urllib3 would sleep out Retry-After inside requests, where
+        # Ctrl+C can't reach it; rate limiting is left to the callers' own backoff
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+    )
+    request_session.mount("https://", adapter)
+    for cookie in driver.get_cookies():
+        # convert cookies to requests
+        request_session.cookies.set(
+            cookie['name'],
+            cookie['value'],
+            domain=cookie['domain'].replace('www.', ''),
+            path=cookie['path']
+        )
+    return request_session
+
+def _response_json(resp):
+    """
+    Decode a requests response body as JSON, with orjson when installed.
+    
+    Raises ValueError on invalid JSON like resp.json() (orjson.JSONDecodeError
+    subclasses it), so existing except clauses keep working.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
 def get_month_data(humble_session, month, timeout=10):
     """Fetch Humble Choice month data. Needs a requests session, not WebDriver."""
-    if type(humble_session) is not requests.Session:
+    if not isinstance(humble_session, requests.Session):
         raise Exception("get_month_data needs a configured requests session")
     # Add timeout to prevent hanging
     r = humble_session.get(HUMBLE_SUB_PAGE + month["product"]["choice_url"], timeout=timeout)
 
-    data_indicator = f'<script id="webpack-monthly-product-data" type="application/json">'
-    jsondata = r.text.split(data_indicator)[1].split("</script>")[0].strip()
-    jsondata = json.loads(jsondata)
+    data_indicator = '<script id="webpack-monthly-product-data" type="application/json">'
+    # Slice the JSON out by offset instead of splitting the whole page into lists
+    page = r.text
+    start = page.index(data_indicator) + len(data_indicator)
+    end = page.find("</script>", start)
+    jsondata = page[start:end if end != -1 else len(page)].strip()
+    jsondata = orjson.loads(jsondata) if HAS_ORJSON else json.loads(jsondata)
     return jsondata["contentChoiceOptions"]
 
 
@@ -2030,21 +2407,32 @@ def get_choices(humble_session,order_details):
     months = [
         month for month in order_details 
         if "choice_url" in month.get("product", {})
+        and (month.get("choices_remaining", 0) > 0 or month["product"].get("is_subs_v3_product",False))
     ]
 
     # Oldest to Newest order
     months = sorted(months,key=lambda m: m.get("created", 0))
-    request_session = requests.Session()
-    for cookie in humble_session.get_cookies():
-        # convert cookies to requests
-        request_session.cookies.set(cookie['name'],cookie['value'],domain=cookie['domain'].replace('www.',''),path=cookie['path'])
+    request_session = get_humble_requests_session(humble_session)
 
-    choices = []
-    for month in months:
-        if month.get("choices_remaining", 0) > 0 or month.get("product", {}).get("is_subs_v3_product",False):
+    # Fetch a few months ahead over the pooled session while the caller handles
+    # the current one; months are still yielded oldest first, and stopping early
+    # leaves at most CHOICE_PREFETCH_MONTHS fetches to cancel
+    fetch_executor = ThreadPoolExecutor(max_workers=CHOICE_PREFETCH_MONTHS + 1)
+    month_futures = [None] * len(months)
+    
+    def submit_fetch(idx):
+        if idx < len(months):
+            month_futures[idx] = fetch_executor.submit(get_month_data, request_session, months[idx])
+    
+    for idx in range(CHOICE_PREFETCH_MONTHS):
+        submit_fetch(idx)
+    try:
+        for idx, month in enumerate(months):
+            submit_fetch(idx + CHOICE_PREFETCH_MONTHS)
+            month_future = month_futures[idx]
             chosen_games = set(find_dict_keys(month.get("tpkd_dict", {}),"machine_name"))
 
-            month["choice_data"] = get_month_data(request_session,month)
+            month["choice_data"] = month_future.result()
             if not month["choice_data"].get('canRedeemGames',True):
                 month["available_choices"] = []
                 continue
@@ -2067,11 +2455,30 @@ def get_choices(humble_session,order_details):
             month["available_choices"] = [
                     game[1]
                     for game in choice_options.items()
-                    if set(find_dict_keys(game[1],"machine_name")).isdisjoint(chosen_games)
+                    if chosen_games.isdisjoint(find_dict_keys(game[1],"machine_name"))
             ]
             month["parent_identifier"] = identifier
             if len(month["available_choices"]):
                 yield month
+    finally:
+        # Drop any fetches still queued (cancel_futures needs Python 3.9)
+        for month_future in month_futures:
+            if month_future is not None:
+                month_future.cancel()
+        fetch_executor.shutdown(wait=False)
+
+
+# Messages for Steam's purchase_result_details codes (read-only, built once)
+STEAM_ERROR_MESSAGES = MappingProxyType({
+    14: "The product code you've entered is not valid. Please double check to see if you've mistyped your key.",
+    15: "The product code you've entered has already been activated by a different Steam account.",
+    53: "There have been too many recent activation attempts. Rate limited - wait and try again later.",
+    13: "Sorry, but this product is not available for purchase in this country.",
+    9: "This Steam account already owns the product(s) contained in this offer.",
+    24: "The product code you've entered requires ownership of another product before activation (DLC/expansion).",
+    36: "The product code requires that you first play this game on PlayStation®3.",
+    50: "The code you have entered is from a Steam Gift Card or Steam Wallet Code. Redeem at: https://store.steampowered.com/account/redeemwalletcode",
+})
 
 
 def _redeem_steam(session, key, quiet=False):
@@ -2109,7 +2516,7 @@ def _redeem_steam(session, key, quiet=False):
             )
         return 53  # Return rate limit error code
     try:
-        blob = r.json()
+        blob = _response_json(r)
     except ValueError:
         # Steam occasionally returns HTML or empty responses; treat as transient failure
         body_preview = r.text[:200].replace("\n", " ")
@@ -2130,17 +2537,7 @@ def _redeem_steam(session, key, quiet=False):
                 error_code = error_code.get("result_detail")
         error_code = error_code or 53
 
-        error_messages = {
-            14: "The product code you've entered is not valid. Please double check to see if you've mistyped your key.",
-            15: "The product code you've entered has already been activated by a different Steam account.",
-            53: "There have been too many recent activation attempts. Rate limited - wait and try again later.",
-            13: "Sorry, but this product is not available for purchase in this country.",
-            9: "This Steam account already owns the product(s) contained in this offer.",
-            24: "The product code you've entered requires ownership of another product before activation (DLC/expansion).",
-            36: "The product code requires that you first play this game on PlayStation®3.",
-            50: "The code you have entered is from a Steam Gift Card or Steam Wallet Code. Redeem at: https://store.steampowered.com/account/redeemwalletcode",
-        }
-        error_message = error_messages.get(
+        error_message = STEAM_ERROR_MESSAGES.get(
             error_code,
             f"An unexpected error has occurred (code {error_code}). Your product code has not been redeemed."
         )
@@ -2159,31 +2556,58 @@ def remove_from_errored_csv(gamekey, human_name):
     if not os.path.exists(errored_file):
         return
     
+    name_lower = human_name.lower()
+    temp_file = errored_file + ".tmp"
     try:
-        # Read all entries except the one to remove
-        remaining_entries = []
-        with open(errored_file, "r", encoding="utf-8-sig") as f:
-            reader = csv.reader(f)
+        # Stream entries into a temp file, skipping the one to remove
+        removed = False
+        with open(errored_file, "r", encoding=CSV_ENCODING, newline='') as src, \
+                open(temp_file, "w", encoding=CSV_ENCODING, newline='') as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
             header = next(reader, None)
+            if header:
+                writer.writerow(header)
             
             for row in reader:
                 if len(row) >= 2:
-                    row_gamekey = row[0].strip()
-                    row_name = row[1].strip().lower()
                     # Keep entry if it doesn't match
-                    if not (row_gamekey == gamekey and row_name == human_name.lower()):
-                        remaining_entries.append(row)
+                    if row[0].strip() == gamekey and row[1].strip().lower() == name_lower:
+                        removed = True
+                    else:
+                        writer.writerow(row)
         
-        # Rewrite file without the removed entry
-        with open(errored_file, "w", encoding="utf-8-sig", newline='') as f:
-            writer = csv.writer(f)
-            if header:
-                writer.writerow(header)
-            writer.writerows(remaining_entries)
+        # Only replace errored.csv when something was actually removed
+        if removed:
+            os.replace(temp_file, errored_file)
+        else:
+            os.remove(temp_file)
     except Exception as e:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
         print(f"[DEBUG] Failed to remove entry from errored.csv: {e}", file=sys.stderr, flush=True)
 
 
+def iter_errored_rows():
+    """
+    Yield data rows from errored.csv, skipping the header row if present.
+    
+    Rows are yielded as read (unstripped, any length); callers apply their
+    own column checks. Yields nothing if the file doesn't exist.
+    """
+    if not os.path.exists(CSVFiles.ERRORED):
+        return
+    with open(CSVFiles.ERRORED, "r", encoding=CSV_ENCODING, newline='') as f:
+        reader = csv.reader(f)
+        first_row = next(reader, None)
+        if first_row and first_row[0].lower() != "gamekey":
+            # First row is data, not header
+            yield first_row
+        yield from reader
+
+
 def wait_for_rate_limit_clear(
     steam_session,
     key_val: str,
@@ -2226,7 +2650,7 @@ def wait_for_rate_limit_clear(
             )
             last_update = seconds_waited
         
-        time.sleep(check_interval)
+        interruptible_sleep(check_interval)
         seconds_waited += check_interval
         
         # Keep session alive periodically (less frequently to reduce noise)
@@ -2330,6 +2754,7 @@ def get_csv_writer(code: Union[SteamErrorCode, int, str]):
 # Thread-safe with locking to prevent race conditions in multi-threaded scenarios
 _EXISTING_KEYS_CACHE = {}
 _CACHE_INITIALIZED = False
+_CACHE_FILE_STATS = {}  # filename -> (size, mtime_ns) when the cache last matched the file
 _CACHE_LOCK = threading.Lock()  # Thread lock for cache operations
 
 def _initialize_keys_cache():
@@ -2367,6 +2792,19 @@ def _get_cached_keys(filename):
     with _CACHE_LOCK:
         return _EXISTING_KEYS_CACHE.get(filename, set()).copy()
 
+def _is_cached_key(filename, gamekey, human_name):
+    """
+    Check whether (gamekey, name) is in the cached keys for a filename.
+    
+    Looks up the cached set under the lock instead of copying it, so
+    per-write duplicate checks stay O(1) as the CSVs grow.
+    """
+    if not _CACHE_INITIALIZED:
+        _initialize_keys_cache()
+    
+    with _CACHE_LOCK:
+        return is_duplicate(gamekey, human_name, _EXISTING_KEYS_CACHE.get(filename, ()))
+
 def _update_keys_cache(filename, gamekey, human_name):
     """Update the cache after writing a new key. Thread-safe."""
     with _CACHE_LOCK:
@@ -2388,7 +2826,7 @@ def get_existing_keys(filename):
     
     keys = set()
     try:
-        with open(filename, "r", encoding="utf-8-sig") as f:
+        with open(filename, "r", encoding=CSV_ENCODING, newline='') as f:
             reader = csv.reader(f)
             for row in reader:
                 if len(row) >= 2:
@@ -2417,6 +2855,33 @@ def is_duplicate(gamekey, human_name, existing_keys):
     return (gamekey, human_name.lower()) in existing_keys
 
 
+def get_processed_key_values(filenames):
+    """
+    Return set of key values recorded in any of the given CSV files.
+
+    Each file is read once, so callers can filter with O(1) set lookups
+    instead of scanning every file for every key. Only the
+    redeemed_key_val column (third in every key CSV, including
+    friend_keys.csv) is collected, so gamekeys and names never match.
+
+    Args:
+        filenames: Iterable of CSV file paths
+
+    Returns:
+        Set of stripped redeemed_key_val values from all files
+    """
+    values = set()
+    for filename in filenames:
+        try:
+            with open(filename, "r", encoding=CSV_ENCODING, newline='') as f:
+                values.update(row[2].strip() for row in csv.reader(f) if len(row) >= 3)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Error reading {filename}: {e}")
+    return values
+
+
 def write_key(code: Union[SteamErrorCode, int, str], key: Dict[str, Any]) -> None:
     """
     Write key to appropriate CSV file with proper CSV escaping and duplicate prevention.
@@ -2444,8 +2909,7 @@ def write_key(code: Union[SteamErrorCode, int, str], key: Dict[str, Any]) -> Non
     # Use cached keys for O(1) lookup instead of reading file each time (O(n²) -> O(n))
     with get_csv_writer(code) as f:
         # Check cache first (fast O(1) lookup)
-        cached_keys = _get_cached_keys(filename)
-        if is_duplicate(gamekey, human_name, cached_keys):
+        if _is_cached_key(filename, gamekey, human_name):
             # Duplicate found - skip writing
             # If successfully redeemed but was in errored.csv, remove it
             if code in SUCCESS_CODES:
@@ -2453,16 +2917,20 @@ def write_key(code: Union[SteamErrorCode, int, str], key: Dict[str, Any]) -> Non
             return
         
         # Double-check by reading file while holding lock (prevents race condition with other processes)
-        # This is still O(n) but only happens once per write, and we have the cache for fast checks
-        existing_keys = get_existing_keys(filename)
-        if is_duplicate(gamekey, human_name, existing_keys):
-            # Duplicate found by another process - update cache and skip
-            # Use lock to ensure thread-safe cache update
+        # The O(n) re-read is skipped when size/mtime still match what the cache last saw,
+        # i.e. nobody else has appended since our own last write
+        f.flush()
+        file_stat = os.fstat(f.fileno())
+        if _CACHE_FILE_STATS.get(filename) != (file_stat.st_size, file_stat.st_mtime_ns):
+            existing_keys = get_existing_keys(filename)
+            # Pick up rows other processes added, so later skipped re-reads don't miss them
             with _CACHE_LOCK:
-                _EXISTING_KEYS_CACHE[filename] = existing_keys
-            if code in SUCCESS_CODES:
-                remove_from_errored_csv(gamekey, human_name)
-            return
+                _EXISTING_KEYS_CACHE.setdefault(filename, set()).update(existing_keys)
+            if is_duplicate(gamekey, human_name, existing_keys):
+                # Duplicate found by another process - skip
+                if code in SUCCESS_CODES:
+                    remove_from_errored_csv(gamekey, human_name)
+                return
         
         writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
         writer.writerow([gamekey, human_name, redeemed_key_val])
@@ -2470,6 +2938,9 @@ def write_key(code: Union[SteamErrorCode, int, str], key: Dict[str, Any]) -> Non
         
         # Update cache after successful write
         _update_keys_cache(filename, gamekey, human_name)
+        file_stat = os.fstat(f.fileno())
+        with _CACHE_LOCK:
+            _CACHE_FILE_STATS[filename] = (file_stat.st_size, file_stat.st_mtime_ns)
     
     # If successfully redeemed, remove from errored.csv
     if code in SUCCESS_CODES:  # Success codes (redeemed, already owned, already activated)
@@ -2559,8 +3030,11 @@ def _load_cache(cache_key: str, max_age_hours: int = 24) -> Tuple[Optional[Any],
         return None, False
     
     try:
-        with cache_file.open("r", encoding="utf-8") as f:
-            cache_data = json.load(f)
+        if HAS_ORJSON:
+            cache_data = orjson.loads(cache_file.read_bytes())
+        else:
+            with cache_file.open("r", encoding="utf-8") as f:
+                cache_data = json.load(f)
         
         # Version check - invalidate cache if version mismatch
         cache_version = cache_data.get("version", 1)
@@ -2598,14 +3072,33 @@ def _save_cache(cache_key: str, data: Any) -> bool:
             "cached_at": datetime.now().isoformat(),
             "data": data
         }
-        with cache_file.open("w", encoding="utf-8") as f:
-            json.dump(cache_data, f, indent=2)
+        if HAS_ORJSON:
+            # orjson needs OPT_NON_STR_KEYS to stringify int app-id keys like json does
+            cache_file.write_bytes(orjson.dumps(cache_data, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with cache_file.open("w", encoding="utf-8") as f:
+                json.dump(cache_data, f, indent=2)
         return True
     except (OSError, TypeError) as e:
         logging.debug(f"Cache save error for {cache_key}: {e}")
         return False
 
 
+def _invalidate_cache(cache_key: str) -> None:
+    """
+    Delete a cache file so the next _load_cache call refetches.
+    
+    Args:
+        cache_key: Cache key identifier
+    """
+    try:
+        (CACHE_DIR / f"{cache_key}.json").unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.debug(f"Cache invalidate error for {cache_key}: {e}")
+
+
 def _load_known_owned_apps() -> set:
     """
     Load set of app IDs that Steam has told us we already own.
@@ -2674,12 +3167,34 @@ def _load_steam_api_key(path: str = "steam_api_key.txt") -> str:
 
 
 def _fetch_all_apps(steam_session):
-    """Fetch complete Steam app list via API. Returns list of app dicts. Uses cache (7 days)."""
+    """
+    Fetch complete Steam app list via API. Returns list of app dicts. Uses cache (7 days).
+    
+    An expired cache is updated with only the apps modified since it was
+    written (if_modified_since) instead of downloading the whole list again.
+    Updates never drop apps Steam removed, so once the last full download is
+    older than STEAM_APP_LIST_MAX_STALE_HOURS the whole list is fetched again.
+    """
     # Try to load from cache first (cache for 7 days - Steam app list changes rarely)
-    cached_data, is_valid = _load_cache("steam_app_list", max_age_hours=24*7)
-    if is_valid:
-        print(f"Using cached Steam app list ({len(cached_data)} apps)")
-        return cached_data
+    # Cached as {"full_fetched_at": <epoch of the last full download>, "apps": [...]}
+    cached_data, is_valid = _load_cache("steam_app_list", max_age_hours=STEAM_APP_LIST_MAX_STALE_HOURS)
+    modified_since = None
+    full_fetched_at = time.time()
+    if is_valid and isinstance(cached_data, dict):
+        cached_apps = cached_data.get("apps", [])
+        cached_full_fetched_at = cached_data.get("full_fetched_at", 0)
+        try:
+            cached_at = (CACHE_DIR / "steam_app_list.json").stat().st_mtime
+        except OSError:
+            cached_at = 0
+        # Past the max staleness since the last full download, refetch everything
+        if time.time() - cached_full_fetched_at <= STEAM_APP_LIST_MAX_STALE_HOURS * 3600:
+            if time.time() - cached_at <= STEAM_APP_LIST_CACHE_HOURS * 3600:
+                print(f"Using cached Steam app list ({len(cached_apps)} apps)")
+                return cached_apps
+            if cached_at:
+                modified_since = int(cached_at)
+                full_fetched_at = cached_full_fetched_at
     
     api_key = _load_steam_api_key()
     url = "https://api.steampowered.com/IStoreService/GetAppList/v1/"
@@ -2691,10 +3206,14 @@ def _fetch_all_apps(steam_session):
         "include_software": True,
         "include_hardware": True
     }
-
-    print("Fetching Steam app list... (this may take a few moments)")
+    if modified_since:
+        params["if_modified_since"] = modified_since
+        print("Updating cached Steam app list...")
+    else:
+        print("Fetching Steam app list... (this may take a few moments)")
 
     apps = []
+    fetch_complete = False
     while True:
         try:
             resp = steam_session.get(url, params=params, timeout=30)
@@ -2713,7 +3232,7 @@ def _fetch_all_apps(steam_session):
             sys.exit(1)
 
         try:
-            body = resp.json().get("response", {})
+            body = _response_json(resp).get("response", {})
         except ValueError:
             print("Error: Steam app list response was not JSON. Stopping fetch.")
             break
@@ -2721,13 +3240,24 @@ def _fetch_all_apps(steam_session):
         apps.extend(page)
 
         if not body.get("have_more_results") or not page:
+            fetch_complete = True
             break
 
         params["last_appid"] = body.get("last_appid", params.get("last_appid", 0))
+    
+    if modified_since:
+        # Merge changed apps over the cached list by appid
+        apps_by_id = {app.get("appid"): app for app in cached_apps}
+        apps_by_id.update((app.get("appid"), app) for app in apps)
+        print(f"{len(apps)} apps changed since the last fetch.")
+        apps = list(apps_by_id.values())
+        if not fetch_complete:
+            # Keep the old timestamp so the missed changes are fetched next run
+            return apps
     print(f"Fetched {len(apps)} total apps available on Steam Store.")
     
-    # Save to cache
-    _save_cache("steam_app_list", apps)
+    # Save to cache; an incremental update keeps the original full-download time
+    _save_cache("steam_app_list", {"full_fetched_at": full_fetched_at, "apps": apps})
     print("Cached Steam app list for future use.")
 
     return apps
@@ -2760,11 +3290,11 @@ def _fetch_missing_app_details(steam_session, app_ids):
 
     def fetch_app(appid):
         try:
-            resp = steam_session.get(
+            resp = _response_json(steam_session.get(
                 "https://store.steampowered.com/api/appdetails",
                 params={"appids": appid},
                 timeout=10
-            ).json()
+            ))
             app_data = resp.get(str(appid), {})
             if app_data.get("success") and app_data.get("data"):
                 name = app_data["data"].get("name")
@@ -2821,7 +3351,7 @@ def get_owned_apps(steam_session):
         print(f"Network error while fetching owned apps: {e}")
         return {}
     try:
-        owned_content = resp.json()
+        owned_content = _response_json(resp)
     except ValueError:
         preview = resp.text[:200].replace("\n", " ")
         print(
@@ -2917,6 +3447,33 @@ def _extract_version_numbers(name):
     return name_clean, filtered_versions
 
 
+# fuzzywuzzy's full_process(force_ascii=True) on a str drops U+0080-U+00FF (accented
+# Latin letters, ®, ©, ...) before normalizing; rapidfuzz's default_process keeps them
+_FUZZ_LATIN1_TRANSLATION = dict.fromkeys(range(128, 256))
+_FUZZ_NON_WORD_PATTERN = re.compile(r'(?ui)\W')
+
+
+def _fuzz_full_process(s):
+    """Normalize a name exactly like fuzzywuzzy's full_process(s, force_ascii=True)."""
+    return _FUZZ_NON_WORD_PATTERN.sub(" ", s.translate(_FUZZ_LATIN1_TRANSLATION)).lower().strip()
+
+
+def _token_set_ratio(a, b):
+    """fuzz.token_set_ratio via rapidfuzz when installed, scored like fuzzywuzzy (0-100 int)."""
+    if HAS_RAPIDFUZZ:
+        return int(round(rapidfuzz_fuzz.token_set_ratio(a, b, processor=_fuzz_full_process)))
+    from fuzzywuzzy import fuzz
+    return fuzz.token_set_ratio(a, b)
+
+
+def _token_sort_ratio(a, b):
+    """fuzz.token_sort_ratio via rapidfuzz when installed, scored like fuzzywuzzy (0-100 int)."""
+    if HAS_RAPIDFUZZ:
+        return int(round(rapidfuzz_fuzz.token_sort_ratio(a, b, processor=_fuzz_full_process)))
+    from fuzzywuzzy import fuzz
+    return fuzz.token_sort_ratio(a, b)
+
+
 def match_ownership(owned_app_details, game, filter_live):
     """
     Check if a game matches any owned Steam apps.
@@ -2938,11 +3495,11 @@ def match_ownership(owned_app_details, game, filter_live):
     # Do a string search based on product names.
     # Also strip Steam platform suffix from owned app names for fair comparison
     matches = [
-        (fuzz.token_set_ratio(_strip_platform_suffixes(appname), game_name_clean), appid)
+        (_token_set_ratio(_strip_platform_suffixes(appname), game_name_clean), appid)
         for appid, appname in owned_app_details.items()
     ]
     refined_matches = [
-        (fuzz.token_sort_ratio(_strip_platform_suffixes(owned_app_details[appid]), game_name_clean), appid)
+        (_token_sort_ratio(_strip_platform_suffixes(owned_app_details[appid]), game_name_clean), appid)
         for score, appid in matches
         if score > threshold
     ]
@@ -2979,7 +3536,7 @@ def match_ownership(owned_app_details, game, filter_live):
             
             # If the base names (without versions) match very closely, but versions differ
             # This is likely a different version of the same game - don't match
-            base_name_similarity = fuzz.token_sort_ratio(game_name_for_version, owned_name_clean)
+            base_name_similarity = _token_sort_ratio(game_name_for_version, owned_name_clean)
             if base_name_similarity >= 85:  # Base names are very similar
                 if game_versions != owned_versions:  # But versions differ
                     # Different version - don't match (unless it's a 100% exact match)
@@ -3026,44 +3583,23 @@ def retry_errored_keys(humble_session, steam_session, order_details):
     # IMPORTANT: Deduplicate by (gamekey, name) to prevent processing the same game multiple times
     errored_dict = {}  # (gamekey, name) -> best entry
     try:
-        with open(errored_file, "r", encoding="utf-8-sig") as f:
-            reader = csv.reader(f)
-            # Skip header if present
-            first_row = next(reader, None)
-            if first_row and first_row[0].lower() != "gamekey":
-                # First row is data, not header
-                if len(first_row) >= 3:
-                    gamekey = first_row[0].strip()
-                    human_name = first_row[1].strip()
-                    redeemed_key_val = first_row[2].strip()
-                    key_id = (gamekey, human_name.lower())
-                    # Only keep if we don't have a better (valid) key already
-                    if key_id not in errored_dict or (
-                        not valid_steam_key(errored_dict[key_id]["redeemed_key_val"]) and 
-                        valid_steam_key(redeemed_key_val)
-                    ):
-                        errored_dict[key_id] = {
-                            "gamekey": gamekey,
-                            'human_name': human_name,
-                            "redeemed_key_val": redeemed_key_val
-                        }
-            # Read remaining rows using the same deduplication logic
-            for row in reader:
-                if len(row) >= 3:
-                    gamekey = row[0].strip()
-                    human_name = row[1].strip()
-                    redeemed_key_val = row[2].strip()
-                    key_id = (gamekey, human_name.lower())
-                    # Only keep if we don't have a better (valid) key already
-                    if key_id not in errored_dict or (
-                        not valid_steam_key(errored_dict[key_id]["redeemed_key_val"]) and 
-                        valid_steam_key(redeemed_key_val)
-                    ):
-                        errored_dict[key_id] = {
-                            "gamekey": gamekey,
-                            'human_name': human_name,
-                            "redeemed_key_val": redeemed_key_val
-                        }
+        for row in iter_errored_rows():
+            if len(row) >= 3:
+                gamekey = row[0].strip()
+                human_name = row[1].strip()
+                redeemed_key_val = row[2].strip()
+                key_id = (gamekey, human_name.lower())
+                # Only keep if we don't have a better (valid) key already
+                if key_id not in errored_dict or (
+                    not valid_steam_key(errored_dict[key_id]["redeemed_key_val"]) and 
+                    valid_steam_key(redeemed_key_val)
+                ):
+                    errored_dict[key_id] = {
+                        "gamekey": gamekey,
+                        'human_name': human_name,
+                        "name_lc": key_id[1],  # Lowercased once at ingest
+                        "redeemed_key_val": redeemed_key_val
+                    }
     except Exception as e:
         print(f"Error reading {errored_file}: {e}")
         return
@@ -3091,14 +3627,23 @@ def retry_errored_keys(humble_session, steam_session, order_details):
     
     # Match errored keys back to order_details
     # IMPORTANT: Match by both gamekey AND name to avoid issues with shared gamekeys (Choice months)
-    all_steam_keys = list(find_dict_keys(order_details, "steam_app_id", True))
+    # Index order keys once (first occurrence wins, as with a linear scan)
+    # so each errored entry is matched with dict lookups
+    keys_by_gamekey_name = {}
+    first_key_by_gamekey = {}
+    for key in find_dict_keys(order_details, "steam_app_id", True):
+        key_gamekey = key.get("gamekey", "")
+        key_name = key.get("human_name", "").strip().lower()
+        keys_by_gamekey_name.setdefault((key_gamekey, key_name), key)
+        first_key_by_gamekey.setdefault(key.get("gamekey"), key)
+    
     keys_to_retry = []
+    retried_gamekeys = set()  # Gamekeys already in keys_to_retry
     seen_retry_keys = set()  # Track (gamekey, name) to avoid duplicates
     
     for errored in errored_keys:
         errored_gamekey = errored["gamekey"]
-        errored_name = errored["human_name"].strip().lower()
-        errored_key_val = errored["redeemed_key_val"]
+        errored_name = errored["name_lc"]
         
         # Skip if already processed (deduplication by gamekey + name)
         retry_id = (errored_gamekey, errored_name)
@@ -3107,29 +3652,19 @@ def retry_errored_keys(humble_session, steam_session, order_details):
         seen_retry_keys.add(retry_id)
         
         # Try to find matching key in order_details - prefer exact name match
-        matched = False
-        for key in all_steam_keys:
-            key_gamekey = key.get("gamekey", "")
-            key_name = key.get("human_name", "").strip().lower()
-            
-            # Match by both gamekey AND name for accuracy
-            if key_gamekey == errored_gamekey and key_name == errored_name:
-                # Update with the redeemed_key_val from errored.csv
-                key["redeemed_key_val"] = errored_key_val
-                keys_to_retry.append(key)
-                matched = True
-                break
+        # Match by both gamekey AND name for accuracy
+        key = keys_by_gamekey_name.get(retry_id)
         
         # Fallback: if no exact match, try matching by gamekey only (for backward compatibility)
         # But only if we haven't already added this gamekey
-        if not matched:
-            for key in all_steam_keys:
-                if key.get("gamekey") == errored_gamekey:
-                    # Check if we've already added this gamekey
-                    if not any(k.get("gamekey") == errored_gamekey for k in keys_to_retry):
-                        key["redeemed_key_val"] = errored_key_val
-                        keys_to_retry.append(key)
-                        break
+        if key is None and errored_gamekey not in retried_gamekeys:
+            key = first_key_by_gamekey.get(errored_gamekey)
+        
+        if key is not None:
+            # Update with the redeemed_key_val from errored.csv
+            key["redeemed_key_val"] = errored["redeemed_key_val"]
+            keys_to_retry.append(key)
+            retried_gamekeys.add(key.get("gamekey"))
     
     if not keys_to_retry:
         print("No matching keys found in order details to retry.")
@@ -3384,8 +3919,7 @@ def redeem_steam_keys(humble_session, humble_keys, order_details=None):
             print(f"  ... and {len(friend_keys_skipped) - 3} more (see friend_keys.csv)")
         
         # Save friend keys for later gifting
-        for key, reason, confidence in friend_keys_skipped:
-            save_friend_key(key, reason, confidence)
+        save_friend_keys(friend_keys_skipped)
 
     if len(skipped_games):
         # Skipped games uncertain to be owned by user. Let user choose
@@ -3399,7 +3933,12 @@ def redeem_steam_keys(humble_session, humble_keys, order_details=None):
     print(f"{'='*60}\n")
     # Initialize keep-alive for Humble session
     keepalive = SessionKeepAlive(humble_session, interval=300)  # 5 minutes
-    redeemed = []
+    redeemed = set()  # steam_app_ids and human_names already attempted this run
+    # Gamekeys of Choice months, for explaining failed reveals with a set lookup
+    choice_gamekeys = {
+        order.get("gamekey") for order in (order_details or [])
+        if "choice_url" in order.get("product", {})
+    }
     
     # Track rate limiting statistics
     rate_limit_count = 0
@@ -3423,8 +3962,8 @@ def redeem_steam_keys(humble_session, humble_keys, order_details=None):
             continue
         else:
             if key.get("steam_app_id") != None:
-                redeemed.append(key["steam_app_id"])
-            redeemed.append(key['human_name'])
+                redeemed.add(key["steam_app_id"])
+            redeemed.add(key['human_name'])
 
         if "redeemed_key_val" not in key:
             # Validate session before redemption
@@ -3462,6 +4001,9 @@ def redeem_steam_keys(humble_session, humble_keys, order_details=None):
             
             redeemed_key = redeem_humble_key(humble_session, key)
             key["redeemed_key_val"] = redeemed_key
+            if redeemed_key:
+                # Cached orders still list this key as unrevealed
+                _invalidate_cache("humble_order_details")
             # Worth noting this will only persist for this loop -- does not get saved to unownedgames' obj
             
             # Check if reveal failed - provide better error messages
@@ -3504,15 +4046,7 @@ def redeem_steam_keys(humble_session, humble_keys, order_details=None):
                 else:
                     # Reveal failed for non-session reasons - check if it's a Choice game
                     # For Humble Choice games, they must be SELECTED before revealing
-                    is_choice_game = False
-                    if order_details:
-                        for order in order_details:
-                            if order.get("gamekey") == key.get("gamekey"):
-                                if "choice_url" in order.get("product", {}):
-                                    is_choice_game = True
-                                    break
-                    
-                    if is_choice_game:
+                    if key.get("gamekey") in choice_gamekeys:
                         print(f"  -> ⚠️  Reveal failed - game may not be SELECTED in Humble Choice")
                         print(f"     → Go to Humble Choice and ensure this game is selected")
                         print(f"     → Then run the script again")
@@ -3603,18 +4137,21 @@ def redeem_steam_keys(humble_session, humble_keys, order_details=None):
     # After successful redemption, check if any Choice months are now complete
     if order_details:
         completed_choice_months = load_completed_choice_months()
+        processed_keys = get_processed_choice_keys()
         newly_completed = []
         for month in order_details:
             if "choice_url" in month.get("product", {}):
                 month_gamekey = month.get('gamekey')
                 if month_gamekey and month_gamekey not in completed_choice_months:
-                    if is_choice_month_complete(month_gamekey, order_details):
-                        mark_choice_month_complete(month_gamekey)
+                    if is_choice_month_complete(month_gamekey, order_details, processed_keys):
+                        completed_choice_months.add(month_gamekey)
                         month_name = month.get("product", {}).get("human_name", "Unknown")
                         newly_completed.append(month_name)
                         logging.info(f"Marked Choice month as complete: {month_name} (gamekey: {month_gamekey})")
         
         if newly_completed:
+            # One write for all newly completed months instead of a load+save per month
+            save_completed_choice_months(completed_choice_months)
             print(f"\n✓ Marked {len(newly_completed)} Choice month(s) as complete (will skip in future runs):")
             for name in newly_completed:
                 print(f"  • {name}")
@@ -3672,6 +4209,9 @@ def export_mode(humble_session,order_details):
             if(export_unrevealed and confirm_reveal and not revealed):
                 # Redeem key if user requests all keys to be revealed
                 tpk["redeemed_key_val"] = redeem_humble_key(humble_session,tpk)
+                if tpk["redeemed_key_val"]:
+                    # Cached orders still list this key as unrevealed
+                    _invalidate_cache("humble_order_details")
             if(owned_app_details != None and "steam_app_id" in tpk):
                 # User requested Steam Ownership info
                 owned = tpk.get("steam_app_id") in owned_app_details.keys()
@@ -3687,7 +4227,7 @@ def export_mode(humble_session,order_details):
             keys.append(tpk)
     ts = time.strftime("%Y%m%d-%H%M%S")
     filename = f"humble_export_{ts}.csv"
-    with open(filename, 'w', encoding="utf-8-sig") as f:
+    with open(filename, 'w', encoding=CSV_ENCODING) as f:
         f.write(','.join(export_key_headers)+"\n")
         for key in keys:
             row = []
@@ -3908,12 +4448,16 @@ if __name__=="__main__":
             
             # Check if page loaded properly
             try:
-                page_title = driver.title
+                # One round trip for the title and the top of the page, instead of
+                # driver.title plus transferring the whole page_source
+                page_title, page_head = driver.execute_script(
+                    "return [document.title, document.documentElement.outerHTML.slice(0, 1000)];"
+                )
                 print(f"OK (page title: {page_title[:30]}...)")
                 
                 # Check for Cloudflare challenge
-                page_source_preview = driver.page_source[:1000].lower()
-                if "challenge" in page_title.lower() or "cloudflare" in page_source_preview:
+                if (CLOUDFLARE_CHALLENGE_PATTERN.search(page_title)
+                        or CLOUDFLARE_CHALLENGE_PATTERN.search(page_head)):
                     print("WARNING: Possible Cloudflare challenge detected!")
                     print("The page may be blocking automated access.")
             except:
@@ -4274,7 +4818,6 @@ The error details have been logged for debugging.
             except Exception as e:
                 print("FAILED")
                 print(f"\nError fetching order details: {type(e).__name__}: {e}")
-                import traceback
                 traceback.print_exc()
                 driver.quit()
                 sys.exit(1)
@@ -4298,8 +4841,6 @@ The error details have been logged for debugging.
         _initialize_keys_cache()
         print("OK")
         
-        unrevealed_keys = []
-        revealed_keys = []
         steam_keys = list(find_dict_keys(order_details,"steam_app_id",True))
         total_steam_keys = len(steam_keys)
 
@@ -4317,56 +4858,37 @@ The error details have been logged for debugging.
             if friend_keys_prefiltered:
                 print(f"Pre-filtered {len(friend_keys_prefiltered)} friend/co-op keys")
                 # Save them to friend_keys.csv
-                for key, reason, confidence in friend_keys_prefiltered:
-                    save_friend_key(key, reason, confidence)
+                save_friend_keys(friend_keys_prefiltered)
             
             steam_keys = non_friend_keys
 
         # Load keys that should be excluded (already processed successfully)
-        exclude_filters = CSVFiles.get_exclusion_filters()
         original_length = len(steam_keys)
-        for filter_file in exclude_filters:
-            try:
-                with open(filter_file, "r", encoding="utf-8-sig") as f:
-                    keycols = f.read()
-                filtered_keys = [keycol.strip() for keycol in keycols.replace("\n", ",").split(",")]
-                steam_keys = [key for key in steam_keys if key.get("redeemed_key_val",False) not in filtered_keys]
-            except FileNotFoundError:
-                pass
-            except Exception as e:
-                print(f"Warning: Error reading {filter_file}: {e}")
-        
+        processed_values = get_processed_key_values(CSVFiles.get_exclusion_filters())
+
         # Load problematic keys (from errored.csv) - these will be tried LAST
         # IMPORTANT: Match by BOTH gamekey AND name to avoid issues with shared gamekeys (Choice months)
         problematic_keys = []
         problematic_by_name = set()  # Track by (gamekey, name) for exact matching
-        errored_file = CSVFiles.ERRORED
-        if os.path.exists(errored_file):
-            try:
-                with open(errored_file, "r", encoding="utf-8-sig") as f:
-                    reader = csv.reader(f)
-                    # Skip header if present
-                    first_row = next(reader, None)
-                    if first_row and first_row[0].lower() != "gamekey":
-                        # First row is data, not header
-                        if len(first_row) >= 2:
-                            gamekey = first_row[0].strip()
-                            name = first_row[1].strip().lower()
-                            problematic_by_name.add((gamekey, name))
-                    # Read remaining rows
-                    for row in reader:
-                        if len(row) >= 2:
-                            gamekey = row[0].strip()
-                            name = row[1].strip().lower()
-                            problematic_by_name.add((gamekey, name))
-            except Exception as e:
-                print(f"Warning: Error reading {errored_file}: {e}")
+        try:
+            for row in iter_errored_rows():
+                if len(row) >= 2:
+                    gamekey = row[0].strip()
+                    name = row[1].strip().lower()
+                    problematic_by_name.add((gamekey, name))
+        except Exception as e:
+            print(f"Warning: Error reading {CSVFiles.ERRORED}: {e}")
         
         # Separate keys into normal and problematic (match by gamekey AND name)
         # IMPORTANT: Deduplicate problematic_keys to avoid processing the same game multiple times
+        # Exclusion, problematic split and revealed/unrevealed partition share one pass
         normal_keys = []
+        revealed_keys = []
+        unrevealed_keys = []
         problematic_seen = set()  # Track (gamekey, name) combinations already added
         for key in steam_keys:
+            if key.get("redeemed_key_val", False) in processed_values:
+                continue  # Already processed successfully
             gamekey = key.get("gamekey", "")
             key_name = key.get("human_name", "").strip().lower()
             
@@ -4381,6 +4903,11 @@ The error details have been logged for debugging.
                 # else: silently skip duplicate
             else:
                 normal_keys.append(key)
+                if "redeemed_key_val" in key:
+                    revealed_keys.append(key)
+                else:
+                    # Has not been revealed via Humble yet
+                    unrevealed_keys.append(key)
         
         # Use normal keys for main processing, problematic keys will be retried at the end
         steam_keys = normal_keys
@@ -4395,13 +4922,6 @@ The error details have been logged for debugging.
         else:
             print(f"Found {total_steam_keys} Steam keys, {unredeemed_count} unredeemed")
 
-        for key in steam_keys:
-            if "redeemed_key_val" in key:
-                revealed_keys.append(key)
-            else:
-                # Has not been revealed via Humble yet
-                unrevealed_keys.append(key)
-
         print(
             f"{len(steam_keys)} Steam keys total -- {len(revealed_keys)} revealed, {len(unrevealed_keys)} unrevealed"
         )
@@ -4410,14 +4930,7 @@ The error details have been logged for debugging.
         unrevealed_choice_games = []
         if unrevealed_keys and order_details:
             # Create a requests session for Choice API calls
-            request_session = requests.Session()
-            for cookie in driver.get_cookies():
-                request_session.cookies.set(
-                    cookie['name'],
-                    cookie['value'],
-                    domain=cookie['domain'].replace('www.', ''),
-                    path=cookie['path']
-                )
+            request_session = get_humble_requests_session(driver)
             
             # Find Choice months with unselected games
             choice_months = [
@@ -4438,6 +4951,11 @@ The error details have been logged for debugging.
             if skipped_count > 0:
                 print(f"Skipping {skipped_count} already-completed Choice month(s)")
             
+            # Bucket unrevealed keys by gamekey once instead of rescanning them per month
+            unrevealed_by_gamekey = {}
+            for key in unrevealed_keys:
+                unrevealed_by_gamekey.setdefault(key.get("gamekey", ""), []).append(key)
+            
             # Process Choice months with timeout protection
             print(f"Checking {len(incomplete_months)} Choice months for unselected games...")
             skipped_no_unrevealed = 0
@@ -4454,10 +4972,7 @@ The error details have been logged for debugging.
                 # 1. There are no unrevealed keys for this month, OR
                 # 2. All unrevealed keys are already selected (in tpkd_dict)
                 chosen_games = set(find_dict_keys(month.get("tpkd_dict", {}), "machine_name"))
-                unrevealed_for_month = [
-                    key for key in unrevealed_keys
-                    if key.get("gamekey", "") == month_gamekey
-                ]
+                unrevealed_for_month = unrevealed_by_gamekey.get(month_gamekey, [])
                 
                 # If no unrevealed keys for this month, skip entirely
                 if not unrevealed_for_month:
@@ -4492,45 +5007,52 @@ The error details have been logged for debugging.
                     skip_msg += f" ({skipped_all_selected} with all games selected)"
                 print(f"  {skip_msg}")
             
-            # Now check only the months that need it
-            for idx, month in enumerate(months_to_check, 1):
-                month_name = month.get("product", {}).get("human_name", f"Month {idx}")
-                month_gamekey = month.get("gamekey", "")
-                
-                # Need to fetch month data to check for unselected games
-                try:
-                    # Add timeout protection - get_month_data can hang
-                    print(f"  [{idx}/{len(incomplete_months)}] Checking {month_name}...", end=" ", flush=True)
-                    try:
-                        month["choice_data"] = get_month_data(request_session, month)
-                        print("✓")
-                    except Exception as data_err:
-                        print(f"✗ (skipped: {str(data_err)[:50]})")
-                        logging.debug(f"Error getting month data for {month_name}: {data_err}")
-                        continue
-                    
-                    if not month["choice_data"].get('canRedeemGames', True):
-                        continue
-                    
-                    # Refresh chosen_games after fetching data (should be same, but be safe)
-                    chosen_games = set(find_dict_keys(month.get("tpkd_dict", {}), "machine_name"))
-                    v3 = not month["choice_data"].get("usesChoices", True)
-                    
-                    if v3:
-                        choice_options = month["choice_data"]["contentChoiceData"]["game_data"]
-                    else:
-                        identifier = "initial" if "initial" in month["choice_data"]["contentChoiceData"] else "initial-classic"
-                        if identifier not in month["choice_data"]["contentChoiceData"]:
-                            for key in month["choice_data"]["contentChoiceData"].keys():
-                                if "content_choices" in month["choice_data"]["contentChoiceData"][key]:
-                                    identifier = key
-                                    break
-                        choice_options = month["choice_data"]["contentChoiceData"][identifier]["content_choices"]
+            # Fetch month pages concurrently over the pooled session;
+            # results are still processed (and printed) in month order below
+            fetch_executor = ThreadPoolExecutor(max_workers=CHOICE_FETCH_WORKERS)
+            month_futures = [
+                fetch_executor.submit(get_month_data, request_session, month)
+                for month in months_to_check
+            ]
+            
+            try:
+                # Now check only the months that need it
+                for idx, (month, month_future) in enumerate(zip(months_to_check, month_futures), 1):
+                    month_name = month.get("product", {}).get("human_name", f"Month {idx}")
+                    month_gamekey = month.get("gamekey", "")
                     
-                    # Find unrevealed Choice games that match unrevealed keys
-                    for game_key in unrevealed_keys:
-                        gamekey = game_key.get("gamekey", "")
-                        if gamekey == month.get("gamekey", ""):
+                    # Need to fetch month data to check for unselected games
+                    try:
+                        # Add timeout protection - get_month_data can hang
+                        print(f"  [{idx}/{len(incomplete_months)}] Checking {month_name}...", end=" ", flush=True)
+                        try:
+                            month["choice_data"] = month_future.result()
+                            print("✓")
+                        except Exception as data_err:
+                            print(f"✗ (skipped: {str(data_err)[:50]})")
+                            logging.debug(f"Error getting month data for {month_name}: {data_err}")
+                            continue
+                        
+                        if not month["choice_data"].get('canRedeemGames', True):
+                            continue
+                        
+                        # Refresh chosen_games after fetching data (should be same, but be safe)
+                        chosen_games = set(find_dict_keys(month.get("tpkd_dict", {}), "machine_name"))
+                        v3 = not month["choice_data"].get("usesChoices", True)
+                        
+                        if v3:
+                            choice_options = month["choice_data"]["contentChoiceData"]["game_data"]
+                        else:
+                            identifier = "initial" if "initial" in month["choice_data"]["contentChoiceData"] else "initial-classic"
+                            if identifier not in month["choice_data"]["contentChoiceData"]:
+                                for key in month["choice_data"]["contentChoiceData"].keys():
+                                    if "content_choices" in month["choice_data"]["contentChoiceData"][key]:
+                                        identifier = key
+                                        break
+                            choice_options = month["choice_data"]["contentChoiceData"][identifier]["content_choices"]
+                        
+                        # Find unrevealed Choice games that match unrevealed keys
+                        for game_key in unrevealed_by_gamekey.get(month_gamekey, []):
                             # This is a Choice month key
                             machine_name = game_key.get("machine_name", "")
                             if machine_name:
@@ -4553,11 +5075,17 @@ The error details have been logged for debugging.
                                             break
                                 # If is_selected is True, the game is already selected and just needs reveal
                                 # (will be handled normally by redeem_steam_keys)
-                except Exception as e:
-                    # Skip months that fail to load
-                    print(f"✗ Error: {str(e)[:50]}")
-                    logging.debug(f"Error checking Choice month {month.get('product', {}).get('human_name', 'Unknown')}: {e}")
-                    continue
+                    except Exception as e:
+                        # Skip months that fail to load
+                        print(f"✗ Error: {str(e)[:50]}")
+                        logging.debug(f"Error checking Choice month {month.get('product', {}).get('human_name', 'Unknown')}: {e}", exc_info=True)
+                        continue
+            finally:
+                # Drop any fetches still queued, also when Ctrl+C exits mid-loop
+                # (cancel_futures needs Python 3.9)
+                for month_future in month_futures:
+                    month_future.cancel()
+                fetch_executor.shutdown(wait=False)
             
             if unrevealed_choice_games:
                 print(f"\n✓ Found {len(unrevealed_choice_games)} games that need selection")
@@ -4593,10 +5121,12 @@ The error details have been logged for debugging.
                     if isinstance(order_details, dict) and 'error' in order_details:
                         print(f"Warning: Error refreshing orders: {order_details.get('message', 'Unknown error')}")
                     else:
+                        # Keep the 1 hour order cache in step with the new selections,
+                        # otherwise a re-run would offer the same games again
+                        _save_cache("humble_order_details", order_details)
                         # Re-filter unrevealed keys with updated data
                         steam_keys = list(find_dict_keys(order_details, "steam_app_id", True))
-                        unrevealed_keys = [key for key in steam_keys if "redeemed_key_val" not in key]
-                        revealed_keys = [key for key in steam_keys if "redeemed_key_val" in key]
+                        revealed_keys, unrevealed_keys = partition_revealed_keys(steam_keys)
                         print(f"✓ Updated: {len(revealed_keys)} revealed, {len(unrevealed_keys)} unrevealed")
                 except Exception as e:
                     print(f"Warning: Could not refresh order details: {e}")
@@ -4626,43 +5156,23 @@ The error details have been logged for debugging.
             errored_by_name = {}  # (gamekey, name) -> key_val (preferred - exact match)
             if os.path.exists(CSVFiles.ERRORED):
                 try:
-                    with open(CSVFiles.ERRORED, "r", encoding=CSV_ENCODING) as f:
-                        reader = csv.reader(f)
-                        first_row = next(reader, None)
-                        if first_row and first_row[0].lower() != "gamekey":
-                            if len(first_row) >= 3:
-                                gamekey = first_row[0].strip()
-                                name = first_row[1].strip().lower() if len(first_row) > 1 else ""
-                                key_val = first_row[2].strip()
-                                # Only store if we don't have a better (valid) key already
-                                if name:
-                                    if (gamekey, name) not in errored_by_name or (
-                                        not valid_steam_key(errored_by_name.get((gamekey, name), "")) and 
-                                        valid_steam_key(key_val)
-                                    ):
-                                        errored_by_name[(gamekey, name)] = key_val
-                                if gamekey not in errored_dict or (
-                                    not valid_steam_key(errored_dict.get(gamekey, "")) and 
-                                    valid_steam_key(key_val)
-                                ):
-                                    errored_dict[gamekey] = key_val
-                        for row in reader:
-                            if len(row) >= 3:
-                                gamekey = row[0].strip()
-                                name = row[1].strip().lower() if len(row) > 1 else ""
-                                key_val = row[2].strip()
-                                # Only store if we don't have a better (valid) key already
-                                if name:
-                                    if (gamekey, name) not in errored_by_name or (
-                                        not valid_steam_key(errored_by_name.get((gamekey, name), "")) and 
-                                        valid_steam_key(key_val)
-                                    ):
-                                        errored_by_name[(gamekey, name)] = key_val
-                                if gamekey not in errored_dict or (
-                                    not valid_steam_key(errored_dict.get(gamekey, "")) and 
+                    for row in iter_errored_rows():
+                        if len(row) >= 3:
+                            gamekey = row[0].strip()
+                            name = row[1].strip().lower()
+                            key_val = row[2].strip()
+                            # Only store if we don't have a better (valid) key already
+                            if name:
+                                if (gamekey, name) not in errored_by_name or (
+                                    not valid_steam_key(errored_by_name.get((gamekey, name), "")) and 
                                     valid_steam_key(key_val)
                                 ):
-                                    errored_dict[gamekey] = key_val
+                                    errored_by_name[(gamekey, name)] = key_val
+                            if gamekey not in errored_dict or (
+                                not valid_steam_key(errored_dict.get(gamekey, "")) and 
+                                valid_steam_key(key_val)
+                            ):
+                                errored_dict[gamekey] = key_val
                 except Exception as e:
                     print(f"Warning: Error reading errored.csv: {e}")
             
@@ -4718,9 +5228,12 @@ The error details have been logged for debugging.
             # Save friend keys found in problematic list
             if friend_keys_in_problematic:
                 print(f"Found {len(friend_keys_in_problematic)} friend keys in problematic list - moved to friend_keys.csv")
-                for key, reason, confidence in friend_keys_in_problematic:
-                    save_friend_key(key, f"from errored.csv: {reason}", confidence)
-                    # Remove from errored.csv
+                save_friend_keys(
+                    (key, f"from errored.csv: {reason}", confidence)
+                    for key, reason, confidence in friend_keys_in_problematic
+                )
+                # Remove from errored.csv
+                for key, _reason, _confidence in friend_keys_in_problematic:
                     remove_from_errored_csv(key.get("gamekey", ""), key.get("human_name", ""))
             
             if keys_to_retry:
@@ -4793,7 +5306,6 @@ The error details have been logged for debugging.
         sys.exit(130)
     except Exception as e:
         print(f"\n\nUnexpected error: {e}")
-        import traceback
         traceback.print_exc()
         try:
             if driver:
@@ -0,0 +1,59 @@
+"""
+Check that the rapidfuzz scorers used by match_ownership score names like fuzzywuzzy.
+
+Run with: python -m unittest discover tests
+Skipped when the script's dependencies, fuzzywuzzy or rapidfuzz aren't installed.
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import humblesteamkeysredeemer as redeemer
+    from fuzzywuzzy import fuzz, utils as fuzz_utils
+    HAS_BACKENDS = redeemer.HAS_RAPIDFUZZ
+except ImportError:
+    HAS_BACKENDS = False
+
+# Titles as they show up on Humble/Steam, paired with the spellings the other side uses
+NON_ASCII_NAME_PAIRS = [
+    ("Pokémon Café™", "Pokemon Cafe"),
+    ("Señor Ñandú", "Senor Nandu"),
+    ("The Witcher® 3: Wild Hunt", "The Witcher 3 Wild Hunt"),
+    ("Ori and the Blind Forest®", "Ori and the Blind Forest: Definitive Edition"),
+    ("NieR:Automata™", "NieR Automata"),
+    ("Half-Life²", "Half-Life 2"),
+    ("Øresund – Édition Spéciale", "Oresund Edition Speciale"),
+    ("Ÿs VIII: Lacrimosa of DANA", "Ys VIII: Lacrimosa of DANA"),
+    ("東方 Project ©", "Touhou Project"),
+    ("オクトパストラベラー", "OCTOPATH TRAVELER"),
+    ("Café™", "®"),
+]
+
+
+@unittest.skipUnless(HAS_BACKENDS, "needs the script's dependencies plus fuzzywuzzy and rapidfuzz")
+class FuzzyBackendParityTest(unittest.TestCase):
+
+    def test_processor_matches_fuzzywuzzy_full_process(self):
+        for pair in NON_ASCII_NAME_PAIRS:
+            for name in pair:
+                self.assertEqual(
+                    redeemer._fuzz_full_process(name),
+                    fuzz_utils.full_process(name, force_ascii=True),
+                    name,
+                )
+
+    def test_scores_match_fuzzywuzzy_on_non_ascii_names(self):
+        if fuzz.SequenceMatcher.__module__.startswith("difflib"):
+            # Without python-Levenshtein fuzzywuzzy scores with difflib, which differs from
+            # rapidfuzz (and from fuzzywuzzy's own fast path) regardless of preprocessing
+            self.skipTest("fuzzywuzzy is using difflib; install python-Levenshtein")
+        for a, b in NON_ASCII_NAME_PAIRS:
+            self.assertEqual(redeemer._token_set_ratio(a, b), fuzz.token_set_ratio(a, b), (a, b))
+            self.assertEqual(redeemer._token_sort_ratio(a, b), fuzz.token_sort_ratio(a, b), (a, b))
+
+
+if __name__ == "__main__":
+    unittest.main()